@@ -0,0 +1,123 @@
+"""Schema extensions for Business Backend GraphQL.
+
+Guards against pathological queries: documents whose estimated cost is
+too high are rejected during validation, before any resolver runs.
+"""
+
+from typing import Any
+
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    ValidationContext,
+    ValidationRule,
+    VariableNode,
+)
+from strawberry.extensions import AddValidationRules
+
+from business_backend.api.graphql.types import MAX_PAGE_SIZE
+
+# List fields paginated by a `limit` argument, with their default limit
+PAGINATED_FIELDS: dict[str, int] = {
+    "products": 50,
+    "productsAfter": 50,
+    "searchProducts": 20,
+}
+
+
+def _field_multiplier(field: FieldNode) -> int:
+    """Number of rows a field may return (1 for non-paginated fields)."""
+    default_limit = PAGINATED_FIELDS.get(field.name.value)
+    if default_limit is None:
+        return 1
+
+    for argument in field.arguments:
+        if argument.name.value != "limit":
+            continue
+        if isinstance(argument.value, IntValueNode):
+            return int(argument.value.value)
+        if isinstance(argument.value, VariableNode):
+            # Variable values are unknown at validation time: assume the worst
+            return MAX_PAGE_SIZE
+
+    return default_limit
+
+
+def _selection_set_cost(
+    context: ValidationContext,
+    selection_set: SelectionSetNode | None,
+    visited_fragments: frozenset[str],
+) -> int:
+    """
+    Estimate the cost of a selection set.
+
+    Each field costs 1 plus the cost of its children, multiplied by the
+    page size for paginated list fields.
+    """
+    if selection_set is None:
+        return 0
+
+    cost = 0
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            children_cost = _selection_set_cost(
+                context, selection.selection_set, visited_fragments
+            )
+            cost += 1 + _field_multiplier(selection) * children_cost
+        elif isinstance(selection, InlineFragmentNode):
+            cost += _selection_set_cost(
+                context, selection.selection_set, visited_fragments
+            )
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            fragment = context.get_fragment(name)
+            # Fragment cycles are reported by the standard validation rules
+            if fragment is None or name in visited_fragments:
+                continue
+            cost += _selection_set_cost(
+                context, fragment.selection_set, visited_fragments | {name}
+            )
+    return cost
+
+
+def _create_query_cost_rule(max_cost: int) -> type[ValidationRule]:
+    """Create a validation rule rejecting operations costlier than max_cost."""
+
+    class QueryCostRule(ValidationRule):
+        def enter_operation_definition(
+            self, node: OperationDefinitionNode, *_args: Any
+        ) -> None:
+            cost = _selection_set_cost(self.context, node.selection_set, frozenset())
+            if cost > max_cost:
+                self.report_error(
+                    GraphQLError(
+                        f"Query cost {cost} exceeds maximum allowed cost {max_cost}",
+                        node,
+                    )
+                )
+
+    return QueryCostRule
+
+
+class QueryCostLimiter(AddValidationRules):
+    """
+    Reject queries whose estimated cost exceeds a limit.
+
+    Cost counts selected fields, multiplied by `limit` for paginated list
+    fields (see PAGINATED_FIELDS), so wide pages of nested selections are
+    refused before reaching the database.
+    """
+
+    def __init__(self, max_cost: int = 10_000) -> None:
+        """
+        Initialize limiter.
+
+        Args:
+            max_cost: Maximum allowed cost per operation
+        """
+        super().__init__([_create_query_cost_rule(max_cost)])
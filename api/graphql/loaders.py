@@ -0,0 +1,56 @@
+"""DataLoaders for Business Backend GraphQL.
+
+Loaders batch the lookups issued while resolving one request, so that
+N `product(id:)` selections cost a single database query instead of N.
+They are created lazily and cached on the request context.
+"""
+
+from uuid import UUID
+
+from strawberry.dataloader import DataLoader
+from strawberry.types import Info
+
+from business_backend.database.models import ProductStock
+from business_backend.services.product_service import ProductService
+
+PRODUCT_LOADER_KEY = "product_loader"
+
+
+def create_product_loader(
+    product_service: ProductService,
+) -> DataLoader[UUID, ProductStock | None]:
+    """
+    Create a DataLoader that batches product lookups by ID.
+
+    Args:
+        product_service: ProductService for database queries
+
+    Returns:
+        DataLoader resolving each ID to its ProductStock (or None)
+    """
+
+    async def load_products(keys: list[UUID]) -> list[ProductStock | None]:
+        products = await product_service.get_products_by_ids(keys)
+        by_id = {p.id: p for p in products}
+        return [by_id.get(key) for key in keys]
+
+    return DataLoader(load_fn=load_products)
+
+
+def get_product_loader(
+    info: Info, product_service: ProductService
+) -> DataLoader[UUID, ProductStock | None]:
+    """
+    Get the product loader for the current request, creating it on first use.
+
+    Args:
+        info: Strawberry resolver info (holds the per-request context)
+        product_service: ProductService for database queries
+
+    Returns:
+        Request-scoped product DataLoader
+    """
+    context = info.context
+    if PRODUCT_LOADER_KEY not in context:
+        context[PRODUCT_LOADER_KEY] = create_product_loader(product_service)
+    return context[PRODUCT_LOADER_KEY]
@@ -4,25 +4,113 @@ This module exposes FAQs, Documents, and Products via GraphQL.
 The data is read from CSV files (TenantDataService) and database (ProductService).
 """
 
-from typing import Annotated
+import base64
+import dataclasses
+import json
+import operator
+from collections.abc import Callable
+from datetime import datetime
+from typing import Annotated, Any, TypeVar
 from uuid import UUID
 
 import strawberry
 from aioinject import Inject
 from aioinject.ext.strawberry import inject
+from graphql import GraphQLError
 from loguru import logger
+from strawberry.types import Info
 
+from business_backend.api.graphql.loaders import get_product_loader
 from business_backend.api.graphql.types import (
     FAQ,
+    MAX_PAGE_SIZE,
     Document,
+    PageInfo,
+    ProductStockPage,
     ProductStockType,
     ProductSummaryType,
     SemanticSearchResponse,
 )
+from business_backend.database.models import ProductStock
 from business_backend.services.product_service import ProductService
 from business_backend.services.search_service import SearchService
 from business_backend.services.tenant_data_service import TenantDataService
 
+T = TypeVar("T")
+
+# (kind, FAQResponses attribute) pairs for the standard conversational FAQs.
+# Patterns are read from FAQData.<kind>_patterns.
+_FAQ_KINDS: tuple[tuple[str, str], ...] = (
+    ("greeting", "greeting"),
+    ("farewell", "farewell"),
+    ("gratitude", "gratitude"),
+    ("assistant_info", "assistant_info"),
+    ("help_request", "help_request"),
+)
+
+
+def _row_converter(cls: type[T]) -> Callable[[Any], T]:
+    """
+    Build a function copying same-named attributes of a row into a new `cls`.
+
+    Bypasses the generated keyword-only __init__: all field values are
+    read with one C-level attrgetter and stored through the slot
+    descriptors of the (slotted) GraphQL type.
+    """
+    names = tuple(f.name for f in dataclasses.fields(cls))  # type: ignore[arg-type]
+    get_values = operator.attrgetter(*names)
+    setters = tuple(getattr(cls, name).__set__ for name in names)
+
+    def convert(row: Any) -> T:
+        obj = cls.__new__(cls)
+        for set_value, value in zip(setters, get_values(row)):
+            set_value(obj, value)
+        return obj
+
+    return convert
+
+
+# ProductStock ORM rows (or ProductStockSummary models) -> GraphQL types
+_to_product_stock_type: Callable[[ProductStock], ProductStockType] = _row_converter(
+    ProductStockType
+)
+_to_product_summary_type: Callable[[ProductStock], ProductSummaryType] = _row_converter(
+    ProductSummaryType
+)
+
+
+def _check_pagination(limit: int, offset: int = 0) -> None:
+    """
+    Reject out-of-range pagination arguments before any DB work runs.
+
+    Raises:
+        GraphQLError: If limit is outside 1..MAX_PAGE_SIZE or offset is negative
+    """
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise GraphQLError(f"limit must be between 1 and {MAX_PAGE_SIZE}, got {limit}")
+    if offset < 0:
+        raise GraphQLError(f"offset must be non-negative, got {offset}")
+
+
+def _encode_cursor(p: ProductStock) -> str:
+    """Encode (created_at, id) of a product as an opaque cursor."""
+    raw = json.dumps([p.created_at.isoformat(), str(p.id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by _encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, product_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), UUID(product_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
 
 @strawberry.type
 class BusinessQuery:
@@ -46,86 +134,87 @@ class BusinessQuery:
               }
             }
         """
-        logger.info(f"📋 GraphQL: getFaqs(tenant={tenant})")
+        logger.info("📋 GraphQL: getFaqs(tenant={})", tenant)
 
         try:
             # Read FAQs from CSV using TenantDataService (returns FAQData model)
             faq_data = await data_service.read_faqs_csv(tenant)
         except FileNotFoundError as e:
-            logger.error(f"❌ CSV not found: {e}")
+            logger.error("❌ CSV not found: {}", e)
             return []
 
-        # Convert Pydantic models to GraphQL FAQ list
-        faqs: list[FAQ] = []
-
-        # Greetings
-        if faq_data.greeting_patterns:
-            faqs.append(
-                FAQ(
-                    type="greeting",
-                    patterns=faq_data.greeting_patterns,
-                    response=faq_data.responses.greeting,
-                    category="greeting",
-                )
+        # Convert Pydantic models to GraphQL FAQ list (one entry per kind with patterns)
+        faqs: list[FAQ] = [
+            FAQ(
+                type=kind,
+                patterns=patterns,
+                response=getattr(faq_data.responses, response_attr),
+                category=kind,
             )
+            for kind, response_attr in _FAQ_KINDS
+            if (patterns := getattr(faq_data, f"{kind}_patterns"))
+        ]
 
-        # Farewells
-        if faq_data.farewell_patterns:
-            faqs.append(
-                FAQ(
-                    type="farewell",
-                    patterns=faq_data.farewell_patterns,
-                    response=faq_data.responses.farewell,
-                    category="farewell",
-                )
+        # FAQ items
+        faqs.extend(
+            FAQ(
+                type="faq",
+                patterns=item.patterns,
+                response=item.answer,
+                category=item.category,
             )
+            for item in faq_data.faq_items
+        )
 
-        # Gratitude
-        if faq_data.gratitude_patterns:
-            faqs.append(
-                FAQ(
-                    type="gratitude",
-                    patterns=faq_data.gratitude_patterns,
-                    response=faq_data.responses.gratitude,
-                    category="gratitude",
-                )
-            )
+        logger.info("✅ GraphQL: Returned {} FAQs for tenant: {}", len(faqs), tenant)
+        return faqs
 
-        # Assistant info
-        if faq_data.assistant_info_patterns:
-            faqs.append(
-                FAQ(
-                    type="assistant_info",
-                    patterns=faq_data.assistant_info_patterns,
-                    response=faq_data.responses.assistant_info,
-                    category="assistant_info",
-                )
-            )
+    @strawberry.field
+    @inject
+    async def match_faq(
+        self, tenant: str, message: str, data_service: Annotated[TenantDataService, Inject]
+    ) -> FAQ | None:
+        """
+        Find the FAQ whose patterns match a user message.
 
-        # Help requests
-        if faq_data.help_request_patterns:
-            faqs.append(
-                FAQ(
-                    type="help_request",
-                    patterns=faq_data.help_request_patterns,
-                    response=faq_data.responses.help_request,
-                    category="help_request",
-                )
-            )
+        Example query:
+            query {
+              matchFaq(tenant: "app", message: "What are your hours?") {
+                type
+                response
+                category
+              }
+            }
+        """
+        logger.info("🔎 GraphQL: matchFaq(tenant={})", tenant)
 
-        # FAQ items
-        for item in faq_data.faq_items:
-            faqs.append(
-                FAQ(
-                    type="faq",
-                    patterns=item.patterns,
-                    response=item.answer,
-                    category=item.category,
+        try:
+            faq_data = await data_service.read_faqs_csv(tenant)
+        except FileNotFoundError as e:
+            logger.error("❌ CSV not found: {}", e)
+            return None
+
+        # One scan over every pattern of the tenant (compiled once per CSV version)
+        category = faq_data.matcher.match(message)
+        if category is None:
+            return None
+
+        for kind, response_attr in _FAQ_KINDS:
+            if kind == category:
+                return FAQ(
+                    type=kind,
+                    patterns=getattr(faq_data, f"{kind}_patterns"),
+                    response=getattr(faq_data.responses, response_attr),
+                    category=kind,
                 )
-            )
 
-        logger.info(f"✅ GraphQL: Returned {len(faqs)} FAQs for tenant: {tenant}")
-        return faqs
+        item = next(item for item in faq_data.faq_items if item.category == category)
+        return FAQ(
+            type="faq",
+            patterns=item.patterns,
+            response=item.answer,
+            category=item.category,
+        )
 
     @strawberry.field
     @inject
@@ -145,19 +234,20 @@ class BusinessQuery:
               }
             }
         """
-        logger.info(f"📚 GraphQL: getDocuments(tenant={tenant})")
+        logger.info("📚 GraphQL: getDocuments(tenant={})", tenant)
 
         try:
             # Read chunks from CSV using TenantDataService (returns list[DocumentChunk])
             chunks = await data_service.read_chunks_csv(tenant)
         except FileNotFoundError as e:
-            logger.error(f"❌ CSV not found: {e}")
+            logger.error("❌ CSV not found: {}", e)
             return []
 
         # Convert DocumentChunk models to Document GraphQL type
+        id_prefix = tenant + "_"
         result: list[Document] = [
             Document(
-                id=f"{tenant}_{idx}",  # Generate unique ID
+                id=id_prefix + str(idx),  # Generate unique ID
                 title=chunk.category or "Unknown",  # Use category as title
                 content=chunk.content,
                 category=chunk.category or "general",
@@ -166,7 +256,7 @@ class BusinessQuery:
         ]
 
         logger.info(
-            f"✅ GraphQL: Returned {len(result)} documents for tenant: {tenant}"
+            "✅ GraphQL: Returned {} documents for tenant: {}", len(result), tenant
         )
         return result
 
@@ -196,51 +286,73 @@ class BusinessQuery:
               }
             }
         """
-        logger.info(f"📦 GraphQL: products(limit={limit}, offset={offset})")
+        logger.info("📦 GraphQL: products(limit={}, offset={})", limit, offset)
+        _check_pagination(limit, offset)
 
         products = await product_service.list_products(limit=limit, offset=offset)
 
-        result = [
-            ProductStockType(
-                id=p.id,
-                created_at=p.created_at,
-                last_updated_at=p.last_updated_at,
-                product_id=p.product_id,
-                product_name=p.product_name,
-                product_sku=p.product_sku,
-                supplier_id=p.supplier_id,
-                supplier_name=p.supplier_name,
-                quantity_on_hand=p.quantity_on_hand,
-                quantity_reserved=p.quantity_reserved,
-                quantity_available=p.quantity_available,
-                minimum_stock_level=p.minimum_stock_level,
-                reorder_point=p.reorder_point,
-                optimal_stock_level=p.optimal_stock_level,
-                reorder_quantity=p.reorder_quantity,
-                average_daily_usage=p.average_daily_usage,
-                last_order_date=p.last_order_date,
-                last_stock_count_date=p.last_stock_count_date,
-                expiration_date=p.expiration_date,
-                unit_cost=p.unit_cost,
-                total_value=p.total_value,
-                batch_number=p.batch_number,
-                warehouse_location=p.warehouse_location,
-                shelf_location=p.shelf_location,
-                stock_status=p.stock_status,
-                is_active=p.is_active,
-                notes=p.notes,
-            )
-            for p in products
-        ]
+        result = list(map(_to_product_stock_type, products))
 
-        logger.info(f"✅ GraphQL: Returned {len(result)} products")
+        logger.info("✅ GraphQL: Returned {} products", len(result))
         return result
 
+    @strawberry.field
+    @inject
+    async def products_after(
+        self,
+        product_service: Annotated[ProductService, Inject],
+        after: strawberry.ID | None = None,
+        limit: int = 50,
+    ) -> ProductStockPage:
+        """
+        List products with cursor-based pagination.
+
+        Prefer this over `products(offset:)` for deep pages: the cost of
+        each page is constant instead of growing with the offset.
+
+        Example query:
+            query {
+              productsAfter(after: "cursor-here", limit: 10) {
+                items {
+                  productName
+                  quantityAvailable
+                }
+                pageInfo {
+                  endCursor
+                  hasNextPage
+                }
+              }
+            }
+        """
+        logger.info("📦 GraphQL: productsAfter(after={}, limit={})", after, limit)
+        _check_pagination(limit)
+
+        cursor = _decode_cursor(after) if after else None
+
+        # Fetch one extra row to know whether another page exists
+        products = await product_service.list_products_after(
+            cursor=cursor, limit=limit + 1
+        )
+        has_next_page = len(products) > limit
+        products = products[:limit]
+
+        result = list(map(_to_product_stock_type, products))
+
+        logger.info("✅ GraphQL: Returned {} products", len(result))
+        return ProductStockPage(
+            items=result,
+            page_info=PageInfo(
+                end_cursor=_encode_cursor(products[-1]) if products else None,
+                has_next_page=has_next_page,
+            ),
+        )
+
     @strawberry.field
     @inject
     async def product(
         self,
         product_service: Annotated[ProductService, Inject],
+        info: Info,
         id: UUID,
     ) -> ProductStockType | None:
         """
@@ -255,43 +367,16 @@ class BusinessQuery:
               }
             }
         """
-        logger.info(f"📦 GraphQL: product(id={id})")
+        logger.info("📦 GraphQL: product(id={})", id)
 
-        p = await product_service.get_product(id)
+        # Batched with any other product(id:) selections in the same request
+        p = await get_product_loader(info, product_service).load(id)
 
         if p is None:
-            logger.warning(f"⚠️ Product not found: {id}")
+            logger.warning("⚠️ Product not found: {}", id)
             return None
 
-        return ProductStockType(
-            id=p.id,
-            created_at=p.created_at,
-            last_updated_at=p.last_updated_at,
-            product_id=p.product_id,
-            product_name=p.product_name,
-            product_sku=p.product_sku,
-            supplier_id=p.supplier_id,
-            supplier_name=p.supplier_name,
-            quantity_on_hand=p.quantity_on_hand,
-            quantity_reserved=p.quantity_reserved,
-            quantity_available=p.quantity_available,
-            minimum_stock_level=p.minimum_stock_level,
-            reorder_point=p.reorder_point,
-            optimal_stock_level=p.optimal_stock_level,
-            reorder_quantity=p.reorder_quantity,
-            average_daily_usage=p.average_daily_usage,
-            last_order_date=p.last_order_date,
-            last_stock_count_date=p.last_stock_count_date,
-            expiration_date=p.expiration_date,
-            unit_cost=p.unit_cost,
-            total_value=p.total_value,
-            batch_number=p.batch_number,
-            warehouse_location=p.warehouse_location,
-            shelf_location=p.shelf_location,
-            stock_status=p.stock_status,
-            is_active=p.is_active,
-            notes=p.notes,
-        )
+        return _to_product_stock_type(p)
 
     @strawberry.field
     @inject
@@ -313,26 +398,14 @@ class BusinessQuery:
               }
             }
         """
-        logger.info(f"🔍 GraphQL: searchProducts(name={name}, limit={limit})")
+        logger.info("🔍 GraphQL: searchProducts(name={}, limit={})", name, limit)
+        _check_pagination(limit)
 
         products = await product_service.search_by_name(name=name, limit=limit)
 
-        result = [
-            ProductSummaryType(
-                id=p.id,
-                product_name=p.product_name,
-                product_sku=p.product_sku,
-                supplier_name=p.supplier_name,
-                quantity_available=p.quantity_available,
-                stock_status=p.stock_status,
-                unit_cost=p.unit_cost,
-                warehouse_location=p.warehouse_location,
-                is_active=p.is_active,
-            )
-            for p in products
-        ]
+        result = list(map(_to_product_summary_type, products))
 
-        logger.info(f"✅ GraphQL: Found {len(result)} products matching '{name}'")
+        logger.info("✅ GraphQL: Found {} products matching '{}'", len(result), name)
         return result
 
     # =====================
@@ -364,27 +437,15 @@ class BusinessQuery:
               }
             }
         """
-        logger.info(f"🤖 GraphQL: semanticSearch(query={query})")
+        logger.info("🤖 GraphQL: semanticSearch(query={})", query)
 
         response = await search_service.semantic_search(query)
 
-        products_found = [
-            ProductSummaryType(
-                id=p.id,
-                product_name=p.product_name,
-                product_sku=p.product_sku,
-                supplier_name=p.supplier_name,
-                quantity_available=p.quantity_available,
-                stock_status=p.stock_status,
-                unit_cost=p.unit_cost,
-                warehouse_location=p.warehouse_location,
-                is_active=p.is_active,
-            )
-            for p in response.products_found
-        ]
+        products_found = list(map(_to_product_summary_type, response.products_found))
 
         logger.info(
-            f"✅ GraphQL: Semantic search completed. Found {len(products_found)} products"
+            "✅ GraphQL: Semantic search completed. Found {} products",
+            len(products_found),
         )
 
         return SemanticSearchResponse(
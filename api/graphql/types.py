@@ -1,13 +1,41 @@
-"""GraphQL types for Business Backend."""
+"""GraphQL types for Business Backend.
+
+Row types (ProductStockType, ProductSummaryType, ...) only declare plain
+data fields, which Strawberry resolves synchronously with its default
+resolver. Keep them free of async field resolvers: resolvers build these
+objects eagerly from already-fetched rows, and an async field would add
+an event-loop hop per field per row.
+"""
 
 from datetime import date, datetime
 from decimal import Decimal
+from typing import TypeVar
 from uuid import UUID
 
 import strawberry
 
+MAX_PAGE_SIZE = 200
+
+T = TypeVar("T")
+
+
+def _with_slots(cls: type[T]) -> type[T]:
+    """
+    Recreate a class with __slots__ for its annotated fields.
+
+    Equivalent of dataclass(slots=True), which @strawberry.type doesn't
+    expose: apply it below @strawberry.type. List rows then carry no
+    per-instance __dict__. Fields must not have default values.
+    """
+    namespace = dict(cls.__dict__)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = tuple(cls.__annotations__)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
 
 @strawberry.type
+@_with_slots
 class FAQ:
     """FAQ item with patterns and response."""
 
@@ -18,6 +46,7 @@ class FAQ:
 
 
 @strawberry.type
+@_with_slots
 class Document:
     """Business document with title and content."""
 
@@ -28,6 +57,7 @@ class Document:
 
 
 @strawberry.type
+@_with_slots
 class ProductStockType:
     """Product stock information from database."""
 
@@ -78,6 +108,23 @@ class ProductStockType:
 
 
 @strawberry.type
+class PageInfo:
+    """Relay-style pagination info for cursor-based queries."""
+
+    end_cursor: str | None
+    has_next_page: bool
+
+
+@strawberry.type
+class ProductStockPage:
+    """A page of products with the cursor to fetch the next one."""
+
+    items: list[ProductStockType]
+    page_info: PageInfo
+
+
+@strawberry.type
+@_with_slots
 class ProductSummaryType:
     """Simplified product summary for search results."""
 
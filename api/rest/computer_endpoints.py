@@ -1,16 +1,26 @@
 
-from typing import Annotated
+import functools
+from typing import Annotated, Any
+from uuid import UUID
 
 from aioinject import Inject
 from aioinject.ext.fastapi import inject
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
+from business_backend.database.models.computer import Computer
 from business_backend.services.computer_service import ComputerService
 
 router = APIRouter()
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID string (cached: hot IDs are requested repeatedly)."""
+    return UUID(value)
+
+
 class ComputerCreate(BaseModel):
     brand: str
     code: str
@@ -26,68 +36,59 @@ class ComputerResponse(BaseModel):
     description: str | None
 
 
-@router.get("/computers")
+def _to_response(c: Computer) -> dict[str, Any]:
+    """Serialize a Computer row with the ComputerResponse shape."""
+    return {
+        "id": str(c.id),
+        "brand": c.brand,
+        "code": c.code,
+        "price": float(c.price),
+        "description": c.description,
+    }
+
+
+# Endpoints return ORJSONResponse directly: rows are already typed by
+# SQLAlchemy, so FastAPI's response_model validation and jsonable_encoder
+# pass are skipped (response_model is kept for the OpenAPI schema).
+@router.get("/computers", response_model=list[ComputerResponse])
 @inject
 async def get_computers(
     service: Annotated[ComputerService, Inject],
-) -> list[ComputerResponse]:
-    computers = await service.get_all_computers()
-    return [
-        ComputerResponse(
-            id=str(c.id),
-            brand=c.brand,
-            code=c.code,
-            price=float(c.price),
-            description=c.description,
-        )
-        for c in computers
-    ]
-
-
-@router.post("/computers")
+    limit: Annotated[int, Query(ge=1, le=500)] = 500,
+    offset: Annotated[int, Query(ge=0)] = 0,
+) -> ORJSONResponse:
+    computers = await service.get_all_computers(limit=limit, offset=offset)
+    return ORJSONResponse([_to_response(c) for c in computers])
+
+
+@router.post("/computers", response_model=ComputerResponse)
 @inject
 async def create_computer(
     request: ComputerCreate,
     service: Annotated[ComputerService, Inject],
-) -> ComputerResponse:
+) -> ORJSONResponse:
     computer = await service.create_computer(
         brand=request.brand,
         code=request.code,
         price=request.price,
         description=request.description,
     )
-    return ComputerResponse(
-        id=str(computer.id),
-        brand=computer.brand,
-        code=computer.code,
-        price=float(computer.price),
-        description=computer.description,
-    )
+    return ORJSONResponse(_to_response(computer))
 
 
-@router.get("/computers/{computer_id}")
+@router.get("/computers/{computer_id}", response_model=ComputerResponse)
 @inject
 async def get_computer_details(
     computer_id: str,
     service: Annotated[ComputerService, Inject],
-) -> ComputerResponse:
-    from uuid import UUID
-
+) -> ORJSONResponse:
     try:
-        uuid_obj = UUID(computer_id)
+        uuid_obj = _parse_uuid(computer_id)
     except ValueError:
-        from fastapi import HTTPException
         raise HTTPException(status_code=400, detail="Invalid UUID format")
 
     computer = await service.get_computer(uuid_obj)
     if not computer:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Computer not found")
 
-    return ComputerResponse(
-        id=str(computer.id),
-        brand=computer.brand,
-        code=computer.code,
-        price=float(computer.price),
-        description=computer.description,
-    )
+    return ORJSONResponse(_to_response(computer))
@@ -2,62 +2,72 @@
 REST Endpoints for Business Backend.
 """
 
-import shutil
-from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Annotated
+import asyncio
+from typing import Annotated, Any, TypedDict
 
 from aioinject import Inject
 from aioinject.ext.fastapi import inject
 from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
+from business_backend.ml.preprocessing import EncodedImage
 from business_backend.ml.serving.inference_service import InferenceService
 
 router = APIRouter()
 
 
-@router.post("/detect")
+class DetectResponse(TypedDict):
+    """Response body of /detect."""
+
+    status: str
+    filename: str | None
+    prediction: Any
+    confidence: float | None
+    metadata: dict[str, Any] | None
+
+
+@router.post("/detect", response_class=ORJSONResponse)
 @inject
 async def detect_product(
     file: Annotated[UploadFile, File(...)],
     inference_service: Annotated[InferenceService, Inject],
-):
+    inference_semaphore: Annotated[asyncio.Semaphore, Inject],
+) -> ORJSONResponse:
     """
     Detect product in uploaded image.
     
     Uploads an image file and accepts it for processing by the ML Inference Service.
     """
-    logger.info(f"📸 Received file for detection: {file.filename}")
+    logger.info("📸 Received file for detection: {}", file.filename)
     
     try:
-        # Save uploaded file temporarily (to simulate real file processing)
-        # In production, this might stream directly or save to S3
-        suffix = Path(file.filename).suffix if file.filename else ".tmp"
-        with NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-            shutil.copyfileobj(file.file, tmp_file)
-            tmp_path = tmp_file.name
-            
-        logger.debug(f"Saved temp file to: {tmp_path}")
-        
-        # Run inference
-        result = await inference_service.predict(
-            model_name="product_classifier",
-            data=tmp_path,  # Passing file path
-            preprocess=False # Our mock handles paths directly
+        # Read the upload once into memory and hand the bytes to the model
+        # (no temp file: avoids a disk write followed by a disk read)
+        contents = await file.read()
+        logger.debug("Read {} bytes from upload", len(contents))
+
+        # Run inference (bounded: excess requests wait for a free slot)
+        async with inference_semaphore:
+            result = await inference_service.predict(
+                model_name="product_classifier",
+                # Raw encoded image bytes; the demo model classifies by filename
+                data=EncodedImage(contents, file.filename),
+                preprocess=False # Our mock handles bytes directly
+            )
+
+        # Return the response directly: serialized once by orjson, skipping
+        # FastAPI's jsonable_encoder pass
+        return ORJSONResponse(
+            DetectResponse(
+                status="success",
+                filename=file.filename,
+                prediction=result.prediction,
+                confidence=result.confidence,
+                metadata=result.metadata,
+            )
         )
         
-        # Cleanup
-        Path(tmp_path).unlink(missing_ok=True)
-        
-        return {
-            "status": "success",
-            "filename": file.filename,
-            "prediction": result.prediction,
-            "confidence": result.confidence,
-            "metadata": result.metadata
-        }
-        
     except Exception as e:
-        logger.error(f"❌ Error in detection: {str(e)}")
+        logger.error("❌ Error in detection: {}", e)
         raise HTTPException(status_code=500, detail=str(e))
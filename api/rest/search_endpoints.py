@@ -0,0 +1,40 @@
+"""
+REST Semantic Search Endpoint for Business Backend.
+"""
+
+from typing import Annotated
+
+from aioinject import Inject
+from aioinject.ext.fastapi import inject
+from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
+from loguru import logger
+
+from business_backend.services.search_service import SearchService
+
+router = APIRouter()
+
+
+@router.get("/search", response_model=None)
+@inject
+async def semantic_search(
+    q: str,
+    search_service: Annotated[SearchService, Inject],
+) -> ORJSONResponse:
+    """
+    Semantic search over products (REST counterpart of the GraphQL query).
+    """
+    logger.info("🤖 REST: search(q={})", q)
+
+    result = await search_service.semantic_search(q)
+
+    # mode="json": Decimal/UUID fields as JSON strings (orjson can't encode Decimal)
+    return ORJSONResponse(
+        {
+            "answer": result.answer,
+            "query": result.query,
+            "products_found": [
+                p.model_dump(mode="json") for p in result.products_found
+            ],
+        }
+    )
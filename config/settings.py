@@ -18,17 +18,35 @@ def _load_dotenv_once() -> None:
     dotenv.load_dotenv(dotenv.find_dotenv())
 
 
+# Find and load .env at import time (workers import this before serving),
+# not on the first request; variables already set in the environment win
+_load_dotenv_once()
+
+
 class BusinessSettings(BaseSettings):
     """Settings for Business Backend service."""
 
     # Database - same as agent/ (reuses PG_URL)
     pg_url: PostgresDsn
 
+    # Connection pool (set DB_NULL_POOL=true for serverless deployments)
+    db_null_pool: bool = False
+    db_pool_size: int = 25
+    db_max_overflow: int = 25
+    db_pool_recycle: int = 1800  # seconds
+
+    # Loaded model budget (unset = unbounded); idle models are evicted LRU first
+    ml_max_loaded_models: int | None = None
+    ml_max_vram_gb: float | None = None
+
     # OpenAI settings for LLM service (optional)
     openai_api_key: str | None = None
     openai_model: str = "gpt-4.1-mini"
     openai_max_tokens: int = 1024
 
+    # Tenants whose CSV data is loaded at startup (comma-separated)
+    preload_tenants: str = "app"
+
     # Feature flags for modularity
     llm_enabled: bool = True
 
@@ -11,7 +11,9 @@ The business_backend is responsible for:
 - LLM integration for semantic search (optional)
 """
 
+import asyncio
 import functools
+import os
 from collections.abc import Iterable
 from typing import Any
 
@@ -36,11 +38,17 @@ async def create_tenant_data_service() -> TenantDataService:
     Factory function for TenantDataService singleton.
 
     TenantDataService has no dependencies - it only reads CSV files.
+    CSVs of the configured tenants are parsed here so the first request
+    doesn't pay for it.
 
     Returns:
         TenantDataService instance
     """
-    return TenantDataService()
+    settings = get_business_settings()
+    service = TenantDataService()
+    tenants = [t.strip() for t in settings.preload_tenants.split(",") if t.strip()]
+    await service.preload(tenants)
+    return service
 
 
 async def create_session_factory() -> async_sessionmaker[AsyncSession]:
@@ -100,7 +108,11 @@ async def create_model_registry() -> ModelRegistry:
     Returns:
         ModelRegistry instance
     """
-    registry = ModelRegistry()
+    settings = get_business_settings()
+    registry = ModelRegistry(
+        max_loaded=settings.ml_max_loaded_models,
+        max_vram_gb=settings.ml_max_vram_gb,
+    )
     # Pre-register default model for convenience
     from business_backend.ml.models.image_classifier import ImageClassifier
     from business_backend.ml.models.registry import ModelStage
@@ -129,6 +141,19 @@ async def create_inference_service(
     return InferenceService(model_registry=registry)
 
 
+async def create_inference_semaphore() -> asyncio.Semaphore:
+    """
+    Factory function for the semaphore bounding concurrent inferences.
+
+    Sized for CPU inference (half the cores, at least 1) so bursts of
+    /detect requests queue up instead of thrashing the model.
+
+    Returns:
+        asyncio.Semaphore shared by all inference requests
+    """
+    return asyncio.Semaphore(max(1, (os.cpu_count() or 1) // 2))
+
+
 async def create_search_service(
     llm_provider: LLMProvider | None,
     product_service: ProductService,
@@ -158,6 +183,7 @@ def providers() -> Iterable[aioinject.Provider[Any]]:
     - LLMProvider: OpenAI via LangChain (optional)
     - ModelRegistry: ML Model management
     - InferenceService: ML Inference
+    - asyncio.Semaphore: Concurrency limit for inference requests
     - SearchService: Semantic search with LLM
     """
     providers_list: list[aioinject.Provider[Any]] = []
@@ -173,6 +199,7 @@ def providers() -> Iterable[aioinject.Provider[Any]]:
     # ML Services
     providers_list.append(aioinject.Singleton(create_model_registry))
     providers_list.append(aioinject.Singleton(create_inference_service))
+    providers_list.append(aioinject.Singleton(create_inference_semaphore))
 
     # LLM & Search
     providers_list.append(aioinject.Singleton(create_llm_provider_instance))
@@ -6,26 +6,61 @@ Single-tenant async engine using SQLAlchemy 2.0.
 
 import functools
 
+from typing import Any
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine as sa_create_async_engine
 from sqlalchemy.pool import NullPool
 
 from business_backend.config import get_business_settings
 
 
-def create_async_engine(database_url: str) -> AsyncEngine:
+def create_async_engine(
+    database_url: str,
+    null_pool: bool = False,
+    pool_size: int = 25,
+    max_overflow: int = 25,
+    pool_recycle: int = 1800,
+) -> AsyncEngine:
     """
     Create async SQLAlchemy engine.
 
+    By default connections are pooled (AsyncAdaptedQueuePool) so requests
+    reuse open connections instead of paying the connect/auth handshake
+    every time.
+
     Args:
         database_url: PostgreSQL connection URL
+        null_pool: Open a new connection per checkout (serverless)
+        pool_size: Connections kept open in the pool
+        max_overflow: Extra connections allowed above pool_size
+        pool_recycle: Seconds after which a connection is replaced
 
     Returns:
         AsyncEngine instance
     """
+    # asyncpg: keep a larger per-connection prepared statement cache (the
+    # option is asyncpg-specific; other drivers would reject it)
+    driver_args: dict[str, Any] = {}
+    if make_url(database_url).get_driver_name() == "asyncpg":
+        driver_args["connect_args"] = {"prepared_statement_cache_size": 500}
+
+    if null_pool:
+        return sa_create_async_engine(
+            database_url,
+            poolclass=NullPool,
+            echo=False,
+            **driver_args,
+        )
+
     return sa_create_async_engine(
         database_url,
-        poolclass=NullPool,  # Recommended for async
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=True,  # Drop connections closed by the server
         echo=False,
+        **driver_args,
     )
 
 
@@ -38,4 +73,10 @@ def get_engine() -> AsyncEngine:
         Cached AsyncEngine instance
     """
     settings = get_business_settings()
-    return create_async_engine(str(settings.pg_url))
+    return create_async_engine(
+        str(settings.pg_url),
+        null_pool=settings.db_null_pool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+    )
@@ -8,7 +8,20 @@ from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import Boolean, Date, DateTime, Integer, Numeric, SmallInteger, String, Text, text
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Date,
+    DateTime,
+    Index,
+    Integer,
+    Numeric,
+    SmallInteger,
+    String,
+    Text,
+    event,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -19,6 +32,14 @@ class Base(DeclarativeBase):
     pass
 
 
+# Required by the trigram index on product_stocks.product_name
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+
+
 class ProductStock(Base):
     """
     ProductStock model for inventory management.
@@ -27,7 +48,27 @@ class ProductStock(Base):
     """
 
     __tablename__ = "product_stocks"
-    __table_args__ = {"schema": "public"}
+    __table_args__ = (
+        # Keyset pagination: WHERE (created_at, id) > (:ts, :id) ORDER BY created_at, id
+        Index("ix_product_stocks_created_at_id", "created_at", "id"),
+        # Time-range scans: created_at follows insertion order (server_default now())
+        Index("ix_product_stocks_created_at_brin", "created_at", postgresql_using="brin"),
+        # Substring search: product_name ILIKE '%term%' (pg_trgm)
+        Index(
+            "ix_product_stocks_product_name_trgm",
+            "product_name",
+            postgresql_using="gin",
+            postgresql_ops={"product_name": "gin_trgm_ops"},
+        ),
+        # Low-stock report: only active rows at/below their reorder point are
+        # indexed, already in ORDER BY quantity_available order
+        Index(
+            "ix_product_stocks_low_stock",
+            "quantity_available",
+            postgresql_where=text("is_active AND quantity_available <= reorder_point"),
+        ),
+        {"schema": "public"},
+    )
 
     # Primary key
     id: Mapped[UUID] = mapped_column(
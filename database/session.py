@@ -4,6 +4,7 @@ Session Factory for Business Backend.
 Provides async session management using SQLAlchemy 2.0.
 """
 
+import functools
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -12,9 +13,10 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from business_backend.database.connection import get_engine
 
 
+@functools.cache
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """
-    Get async session factory.
+    Get cached async session factory.
 
     Returns:
         async_sessionmaker configured for the engine
@@ -33,6 +35,9 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Async context manager for database sessions.
 
+    The session runs in a single transaction: committed on normal exit,
+    rolled back if the block raises.
+
     Usage:
         async with get_session() as session:
             result = await session.execute(query)
@@ -41,10 +46,5 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         AsyncSession instance
     """
     factory = get_session_factory()
-    async with factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
+    async with factory() as session, session.begin():
+        yield session
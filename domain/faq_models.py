@@ -2,11 +2,22 @@
 Domain models for FAQ and Document data.
 """
 
-from typing import List, Dict, Optional
-from pydantic import BaseModel
+import functools
+import re
+from typing import Iterable, List, Dict, Optional, Tuple
+from pydantic import BaseModel, ConfigDict
+
+# Conversational kinds with patterns in FAQData.<kind>_patterns
+FAQ_KINDS = ("greeting", "farewell", "gratitude", "assistant_info", "help_request")
+
+# Regex constructs that change meaning (or fail) once a pattern is spliced
+# into the combined alternation: named groups, backreferences, inline flags
+_UNSPLICEABLE = re.compile(r"\(\?P<|\(\?P=|\\[1-9]|\(\?[aiLmsux]+\)")
 
 class FAQItemData(BaseModel):
     """Data model for a single FAQ item."""
+    model_config = ConfigDict(frozen=True)
+
     question: str
     patterns: List[str]
     answer: str
@@ -15,6 +26,8 @@ class FAQItemData(BaseModel):
 
 class FAQResponses(BaseModel):
     """Container for standard responses."""
+    model_config = ConfigDict(frozen=True)
+
     greeting: Optional[str] = None
     farewell: Optional[str] = None
     gratitude: Optional[str] = None
@@ -24,6 +37,8 @@ class FAQResponses(BaseModel):
 
 class FAQData(BaseModel):
     """Complete FAQ dataset for a tenant."""
+    model_config = ConfigDict(frozen=True)
+
     greeting_patterns: List[str] = []
     farewell_patterns: List[str] = []
     gratitude_patterns: List[str] = []
@@ -33,9 +48,78 @@ class FAQData(BaseModel):
     responses: FAQResponses
     faq_items: List[FAQItemData] = []
 
+    @functools.cached_property
+    def matcher(self) -> "FAQMatcher":
+        """Matcher over every pattern of this dataset (compiled on first use)."""
+        return FAQMatcher.from_faq_data(self)
+
+
+class FAQMatcher:
+    """
+    Classifies a message against all FAQ patterns in a single regex scan.
+
+    Every pattern becomes one named alternative of a combined regex, so a
+    message is scanned once instead of once per pattern; the alternative
+    that matched maps back to its category. Patterns that are not valid
+    standalone regexes, or would not survive being spliced (named groups,
+    backreferences, inline flags), are matched as whole-word literals.
+    """
+
+    def __init__(self, categorized_patterns: Iterable[Tuple[str, str]]) -> None:
+        categories: List[str] = []
+        alternatives: List[str] = []
+        for category, pattern in categorized_patterns:
+            if pattern:
+                alternatives.append(f"(?P<p{len(categories)}>{_as_alternative(pattern)})")
+                categories.append(category)
+
+        self._categories = tuple(categories)
+        self._regex = (
+            re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+        )
+
+    @classmethod
+    def from_faq_data(cls, faq_data: FAQData) -> "FAQMatcher":
+        """Build a matcher from conversational kinds and FAQ item patterns."""
+        pairs = [
+            (kind, pattern)
+            for kind in FAQ_KINDS
+            for pattern in getattr(faq_data, f"{kind}_patterns")
+        ]
+        pairs.extend(
+            (item.category, pattern)
+            for item in faq_data.faq_items
+            for pattern in item.patterns
+        )
+        return cls(pairs)
+
+    def match(self, message: str) -> Optional[str]:
+        """Return the category of the first matching pattern, or None."""
+        if self._regex is None:
+            return None
+        m = self._regex.search(message.strip())
+        if m is None:
+            return None
+        # The outer named group closes last, so lastgroup is "p<index>"
+        return self._categories[int(m.lastgroup[1:])]
+
+
+def _as_alternative(pattern: str) -> str:
+    """Regex source for one pattern, safe to splice into the alternation."""
+    if not _UNSPLICEABLE.search(pattern):
+        try:
+            re.compile(pattern)
+            return pattern
+        except re.error:
+            pass
+    # Lookarounds rather than \b, which never matches next to punctuation
+    return rf"(?<!\w){re.escape(pattern)}(?!\w)"
+
 
 class DocumentChunk(BaseModel):
     """Data model for a document chunk."""
+    model_config = ConfigDict(frozen=True)
+
     content: str
     category: str
     metadata: Dict[str, str] = {}
@@ -4,17 +4,35 @@ Product Schemas for Business Backend.
 Pydantic models for data validation and serialization.
 """
 
+from collections.abc import Mapping
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Any, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
 
+TRowModel = TypeVar("TRowModel", bound="_DatabaseRowModel")
 
-class ProductStockSchema(BaseModel):
-    """Pydantic schema for ProductStock."""
 
-    model_config = ConfigDict(from_attributes=True)
+class _DatabaseRowModel(BaseModel):
+    """
+    Base for read-only schemas built from database rows.
+
+    Rows are already typed by SQLAlchemy, so from_row() skips Pydantic
+    validation (model_construct). Use model_validate() for untrusted input.
+    """
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    @classmethod
+    def from_row(cls: type[TRowModel], row: Mapping[str, Any]) -> TRowModel:
+        """Build from a trusted column mapping (Result.mappings()) without validation."""
+        return cls.model_construct(**{name: row[name] for name in cls.model_fields})
+
+
+class ProductStockSchema(_DatabaseRowModel):
+    """Pydantic schema for ProductStock."""
 
     id: UUID
     created_at: datetime
@@ -62,11 +80,9 @@ class ProductStockSchema(BaseModel):
     notes: str | None = None
 
 
-class ProductStockSummary(BaseModel):
+class ProductStockSummary(_DatabaseRowModel):
     """Simplified product summary for search results."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: UUID
     product_name: str
     product_sku: str | None = None
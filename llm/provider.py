@@ -4,6 +4,8 @@ LLM Provider for Business Backend.
 Simple OpenAI provider using LangChain for tool calling.
 """
 
+import functools
+
 from langchain_core.language_models import BaseChatModel
 from langchain_openai import ChatOpenAI
 
@@ -54,11 +56,21 @@ def create_llm_provider() -> LLMProvider | None:
     if not settings.openai_api_key:
         return None
 
-    model = ChatOpenAI(
-        api_key=settings.openai_api_key,
-        model=settings.openai_model,
-        max_tokens=settings.openai_max_tokens,
+    return _build_llm_provider(
+        settings.openai_api_key,
+        settings.openai_model,
+        settings.openai_max_tokens,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _build_llm_provider(api_key: str, model: str, max_tokens: int) -> LLMProvider:
+    """Build (once per configuration) the ChatOpenAI client and its provider."""
+    chat_model = ChatOpenAI(
+        api_key=api_key,
+        model=model,
+        max_tokens=max_tokens,
         temperature=0,  # Deterministic for tool calling
     )
 
-    return LLMProvider(model)
+    return LLMProvider(chat_model)
@@ -56,9 +56,10 @@ class ImageRecognitionTool(BaseTool):
             return "Error: Inference service not configured"
 
         try:
-            # Predict using the standard product_classifier model
+            # Predict using the standard product_classifier model; concurrent
+            # tool calls are coalesced into a single predict_batch() call
             # In a real app, we might check if model is loaded or handle missing files
-            result = await self.inference_service.predict(
+            result = await self.inference_service.predict_coalesced(
                 model_name="product_classifier",
                 data=image_path,  # Passing path directly as per our ImageClassifier mock support
                 preprocess=False  # Mock classifier handles path strings directly
@@ -5,14 +5,32 @@ This tool allows the LLM to search products in the database.
 Uses ProductService with SQLAlchemy ORM.
 """
 
+from contextvars import ContextVar
 from typing import Any
 
+import orjson
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from business_backend.database.models import ProductStock
+from business_backend.domain.product_schemas import ProductStockSummary
 from business_backend.services.product_service import ProductService
 
+# Results of the last search in the current task (per request, not per tool:
+# concurrent searches sharing the tool instance don't see each other's results)
+_LAST_RESULTS: ContextVar[list[ProductStockSummary] | None] = ContextVar(
+    "last_results", default=None
+)
+
+# Stock status code -> text (index is the ProductStock.stock_status code)
+_STOCK_STATUS_TEXT = ("Out of Stock", "In Stock", "Low Stock", "Overstock")
+
+
+def _stock_status_text(status: int) -> str:
+    """Convert stock status code to text."""
+    if 0 <= status < len(_STOCK_STATUS_TEXT):
+        return _STOCK_STATUS_TEXT[status]
+    return "Unknown"
+
 
 class ProductSearchInput(BaseModel):
     """Input schema for product search tool."""
@@ -42,11 +60,6 @@ class ProductSearchTool(BaseTool):
     # Service reference (set during initialization)
     product_service: ProductService | None = None
 
-    # Store last search results for the response
-    last_results: list[ProductStock] = []
-
-    model_config = {"arbitrary_types_allowed": True}
-
     def _run(self, search_term: str) -> str:
         """Sync version - not used, raises error."""
         raise NotImplementedError("Use async version")
@@ -61,45 +74,43 @@ class ProductSearchTool(BaseTool):
         Returns:
             Formatted string with product information
         """
+        # Fresh results for this call: never report an earlier search's products
+        _LAST_RESULTS.set([])
+
         if self.product_service is None:
             return "Error: Product service not configured"
 
-        products = await self.product_service.search_by_name(name=search_term, limit=10)
+        products = await self.product_service.search_summary_by_name(
+            name=search_term, limit=10
+        )
 
         # Store results for later use
-        self.last_results = products
+        _LAST_RESULTS.set(products)
 
         if not products:
             return f"No products found matching '{search_term}'"
 
-        # Format results for LLM
-        results = []
-        for p in products:
-            status_text = self._get_stock_status_text(p.stock_status)
-            results.append(
-                f"- {p.product_name} (SKU: {p.product_sku or 'N/A'}): "
-                f"{p.quantity_available} units available, "
-                f"Status: {status_text}, "
-                f"Price: ${p.unit_cost:.2f}, "
-                f"Supplier: {p.supplier_name}, "
-                f"Location: {p.warehouse_location}"
-            )
-
-        return f"Found {len(products)} products:\n" + "\n".join(results)
-
-    def _get_stock_status_text(self, status: int) -> str:
-        """Convert stock status code to text."""
-        status_map = {
-            0: "Out of Stock",
-            1: "In Stock",
-            2: "Low Stock",
-            3: "Overstock",
-        }
-        return status_map.get(status, "Unknown")
-
-    def get_last_results(self) -> list[ProductStock]:
-        """Get the last search results."""
-        return self.last_results
+        # Format results for LLM as one JSON array (single C-level dump)
+        results = orjson.dumps(
+            [
+                {
+                    "name": p.product_name,
+                    "sku": p.product_sku,
+                    "qty": p.quantity_available,
+                    "status": _stock_status_text(p.stock_status),
+                    "price": f"{p.unit_cost:.2f}",
+                    "supplier": p.supplier_name,
+                    "location": p.warehouse_location,
+                }
+                for p in products
+            ]
+        ).decode()
+
+        return f"Found {len(products)} products:\n" + results
+
+    def get_last_results(self) -> list[ProductStockSummary]:
+        """Get the last search results in the current context (empty if none)."""
+        return _LAST_RESULTS.get() or []
 
 
 def create_product_search_tool(product_service: ProductService) -> ProductSearchTool:
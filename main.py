@@ -15,18 +15,27 @@ Usage:
 """
 
 import argparse
+import os
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import strawberry
 import uvicorn
 from aioinject.ext.strawberry import AioInjectExtension
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from loguru import logger
+from strawberry.extensions import ParserCache, QueryDepthLimiter, ValidationCache
 from strawberry.fastapi import GraphQLRouter
 
+from business_backend.api.graphql.extensions import QueryCostLimiter
 from business_backend.api.graphql.queries import BusinessQuery
 from business_backend.api.rest.endpoints import router as detection_router
 from business_backend.api.rest.computer_endpoints import router as computer_router
+from business_backend.api.rest.search_endpoints import router as search_router
 from business_backend.container import create_business_container
+from business_backend.services.tenant_data_service import TenantDataService
 
 
 def create_business_backend_app() -> FastAPI:
@@ -36,18 +45,27 @@ def create_business_backend_app() -> FastAPI:
     Returns:
         FastAPI application with GraphQL endpoint
     """
+    # Create business_backend's own DI container
+    container = create_business_container()
+    logger.info("✅ Business Backend DI container created")
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        # Resolve TenantDataService at startup so tenant CSVs are preloaded
+        async with container.context() as ctx:
+            await ctx.resolve(TenantDataService)
+        yield
+
     app = FastAPI(
         title="Business Backend API",
         description="Provides FAQs and Documents from CSV files via GraphQL",
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,  # orjson instead of stdlib json
     )
 
-    # Create business_backend's own DI container
-    container = create_business_container()
-    logger.info("✅ Business Backend DI container created")
-
     # Connect AioInject middleware
     from aioinject.ext.fastapi import AioInjectMiddleware
     app.add_middleware(AioInjectMiddleware, container=container)
@@ -57,6 +75,10 @@ def create_business_backend_app() -> FastAPI:
         query=BusinessQuery,
         extensions=[
             AioInjectExtension(container),  # Uses business_backend's container
+            QueryDepthLimiter(max_depth=8),  # Reject deeply nested queries
+            QueryCostLimiter(max_cost=10_000),  # Reject huge paginated selections
+            ParserCache(maxsize=512),  # Skip re-parsing repeated documents
+            ValidationCache(maxsize=512),  # Skip re-validating repeated documents
         ],
     )
     logger.info("✅ Business Backend GraphQL schema created")
@@ -71,28 +93,34 @@ def create_business_backend_app() -> FastAPI:
     # Add REST router
     app.include_router(detection_router, prefix="/api", tags=["Detection"])
     app.include_router(computer_router, prefix="/api", tags=["Computers"])
+    app.include_router(search_router, prefix="/api", tags=["Search"])
 
     # Health check endpoint
+    # Static bodies: returned as Response objects, skipping jsonable_encoder
     @app.get("/health")
-    async def health():
+    async def health() -> ORJSONResponse:
         """Health check for business backend service."""
-        return {
-            "status": "ok",
-            "service": "business_backend",
-            "version": "1.0.0",
-        }
+        return ORJSONResponse(
+            {
+                "status": "ok",
+                "service": "business_backend",
+                "version": "1.0.0",
+            }
+        )
 
     @app.get("/")
-    async def root():
+    async def root() -> ORJSONResponse:
         """Root endpoint with service information."""
-        return {
-            "service": "Business Backend API",
-            "version": "1.0.0",
-            "graphql_endpoint": "/graphql",
-            "graphiql_ui": "/graphql (browser)",
-            "health_check": "/health",
-            "docs": "/docs",
-        }
+        return ORJSONResponse(
+            {
+                "service": "Business Backend API",
+                "version": "1.0.0",
+                "graphql_endpoint": "/graphql",
+                "graphiql_ui": "/graphql (browser)",
+                "health_check": "/health",
+                "docs": "/docs",
+            }
+        )
 
     logger.info("✅ Business Backend FastAPI app created")
     return app
@@ -112,22 +140,34 @@ if __name__ == "__main__":
         default="0.0.0.0",
         help="Host to bind to (default: 0.0.0.0)",
     )
+    _ = parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: number of CPUs)",
+    )
 
     args = parser.parse_args()
 
-    app = create_business_backend_app()
-
     # Extract args with explicit types
     host: str = args.host
     port: int = args.port
+    workers: int = args.workers
 
     logger.info(f"🚀 Starting Business Backend on {host}:{port}")
     logger.info(f"📊 GraphiQL UI: http://localhost:{port}/graphql")
     logger.info(f"📖 API Docs: http://localhost:{port}/docs")
 
+    # Import string + factory so each worker process builds its own app.
+    # uvloop/httptools come with uvicorn[standard] (uvloop has no Windows build)
     uvicorn.run(
-        app,
+        "business_backend.main:create_business_backend_app",
+        factory=True,
         host=host,
         port=port,
+        workers=workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="info",
+        access_log=False,
     )
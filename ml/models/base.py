@@ -9,6 +9,8 @@ from abc import ABC, abstractmethod
 from typing import Any
 from pathlib import Path
 
+import numpy as np
+
 
 class BaseModel(ABC):
     """
@@ -23,6 +25,7 @@ class BaseModel(ABC):
     # Override in subclass
     model_type: str = "generic"  # image, text, tabular, audio
     input_shape: tuple[int, ...] | None = None
+    precision: str = "fp32"  # fp32, fp16, int8 (accelerated backends only)
 
     def __init__(self) -> None:
         """Initialize model (not loaded yet)."""
@@ -35,6 +38,11 @@ class BaseModel(ABC):
         """Check if model is loaded."""
         return self._is_loaded
 
+    @property
+    def memory_bytes(self) -> int:
+        """Device memory held by the loaded model (override in subclass; 0 = unknown)."""
+        return 0
+
     @abstractmethod
     async def load(self, path: str | Path) -> None:
         """
@@ -63,7 +71,9 @@ class BaseModel(ABC):
         # Here your code for model inference
         pass
 
-    async def predict_batch(self, data_list: list[Any]) -> list[dict[str, Any]]:
+    async def predict_batch(
+        self, data_list: list[Any]
+    ) -> list[dict[str, Any]] | dict[str, Any]:
         """
         Run batch inference.
 
@@ -71,7 +81,12 @@ class BaseModel(ABC):
             data_list: List of preprocessed inputs
 
         Returns:
-            List of prediction dicts
+            List of prediction dicts, or (for vectorized models) one
+            columnar dict with keys:
+            - predictions: Per-item outputs (sequence)
+            - confidences: Per-item scores (np.ndarray)
+            - class_ids: Per-item class indices (np.ndarray)
+            - metadata: Info shared by every item
         """
         # Here your code for batch inference (default: sequential)
         results = []
@@ -80,6 +95,25 @@ class BaseModel(ABC):
             results.append(result)
         return results
 
+    async def warmup(self, runs: int = 2) -> None:
+        """
+        Run dummy inferences so the first real request doesn't pay one-off
+        backend costs (kernel autotuning, graph compilation, TensorRT
+        context setup, lazy allocations).
+
+        Default: predict on a zero tensor of input_shape `runs` times.
+        No-op for models without a fixed input shape or backend.
+
+        Args:
+            runs: Number of dummy predictions
+        """
+        if self.input_shape is None or self._model is None:
+            return
+
+        dummy = np.zeros(self.input_shape, dtype=np.float32)
+        for _ in range(runs):
+            await self.predict(dummy)
+
     async def unload(self) -> None:
         """Release model from memory."""
         # Here your code for releasing model resources
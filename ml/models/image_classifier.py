@@ -5,10 +5,96 @@ Example implementation of BaseModel for image classification.
 Supports Keras/TensorFlow and PyTorch models.
 """
 
+import asyncio
+import re
+from collections.abc import Callable
 from typing import Any
 from pathlib import Path
 
+import numpy as np
+
 from business_backend.ml.models.base import BaseModel
+from business_backend.ml.preprocessing.image_preprocessor import EncodedImage
+
+# ONNX Runtime providers in order of preference
+_ONNX_PROVIDERS = (
+    "TensorrtExecutionProvider",
+    "CUDAExecutionProvider",
+    "CPUExecutionProvider",
+)
+
+
+# HDF5 files up to this size are read into memory in one go; larger ones stay on disk
+_H5_IN_MEMORY_BYTES = 64 * 1024**2
+
+_TORCH_SUFFIXES = (".pt", ".pth", ".safetensors")
+
+
+# Demo "model": (filename keywords, prediction, confidence)
+_DEMO_RULES: tuple[tuple[tuple[str, ...], str, float], ...] = (
+    (("milk", "leche"), "Leche Entera 1L", 0.98),
+    (("coffee", "cafe"), "Café Molido Premium", 0.95),
+    (("cereal",), "Cereal Avena", 0.92),
+)
+
+
+def _build_demo_classifier(
+    rules: tuple[tuple[tuple[str, ...], str, float], ...],
+) -> Callable[[Any], dict[str, Any]]:
+    """
+    Specialize the demo classifier for a fixed rule table.
+
+    All keywords are compiled into one alternation and mapped to their
+    rule in a dict, so a call lowercases the input once and finds every
+    keyword occurrence in a single regex scan. As with an if/elif chain
+    over the rules, the earliest rule with a keyword in the input wins,
+    wherever in the input that keyword appears.
+    """
+    # keyword -> (rule index, prediction, confidence); earlier rules keep shared keywords
+    by_keyword: dict[str, tuple[int, str, float]] = {}
+    for index, (keywords, rule_prediction, rule_confidence) in enumerate(rules):
+        for keyword in keywords:
+            by_keyword.setdefault(keyword, (index, rule_prediction, rule_confidence))
+    # Zero-width lookahead: matches may overlap, so no occurrence is skipped.
+    # Alternatives in rule order: at one position the highest-priority keyword wins.
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, by_keyword)) + "))")
+
+    def classify(data: Any) -> dict[str, Any]:
+        # Determine "prediction" based on input filename if it's a string (for demo)
+        prediction = "unknown_product"
+        confidence = 0.85
+
+        if isinstance(data, EncodedImage):
+            data = data.filename
+        if isinstance(data, str):
+            best = min(
+                (by_keyword[match.group(1)] for match in pattern.finditer(data.lower())),
+                default=None,
+            )
+            if best is not None:
+                _, prediction, confidence = best
+
+        return {
+            "prediction": prediction,
+            "confidence": confidence,
+            "class_id": 0,  # Dummy ID
+            "metadata": {"model_version": "1.0.0"},
+        }
+
+    return classify
+
+
+class _OnnxBackend:
+    """Adapts an ONNX Runtime session to the model.predict(batch) interface."""
+
+    def __init__(self, session: Any) -> None:
+        self._session = session
+        self._input_name = session.get_inputs()[0].name
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        """Run the session on a (N, H, W, C) batch."""
+        inputs = {self._input_name: batch.astype(np.float32, copy=False)}
+        return self._session.run(None, inputs)[0]
 
 
 class ImageClassifier(BaseModel):
@@ -19,7 +105,7 @@ class ImageClassifier(BaseModel):
     - Keras H5 format (.h5)
     - Keras JSON + weights (model.json + weights.h5)
     - TensorFlow SavedModel format (directory)
-    - PyTorch (.pt, .pth)
+    - PyTorch (.pt, .pth, .safetensors)
     - ONNX (.onnx)
     """
 
@@ -30,6 +116,17 @@ class ImageClassifier(BaseModel):
         """Initialize classifier."""
         super().__init__()
         self._class_labels: list[str] = []
+        # Memory-mapped weights (torch state dict) or open h5py.File
+        self._weights_handle: Any = None
+        # On-disk size of a loaded ONNX/Keras model file
+        self._model_file_bytes = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        """Size of the loaded weights (model file size for ONNX/Keras; 0 = mock)."""
+        if isinstance(self._weights_handle, dict):  # torch state dict
+            return sum(tensor.nbytes for tensor in self._weights_handle.values())
+        return self._model_file_bytes if self._model is not None else 0
 
     async def load(self, path: str | Path) -> None:
         """
@@ -39,7 +136,16 @@ class ImageClassifier(BaseModel):
             path: Path to model file or directory
         """
         self.loading_path = str(path)
-        # Simulation: In a real scenario, we would load TensorFlow/PyTorch here.
+        pure_path = Path(path)
+        if pure_path.suffix == ".onnx" and pure_path.is_file():
+            await self._load_onnx(pure_path)
+            self._model_file_bytes = pure_path.stat().st_size
+        elif pure_path.suffix == ".h5" and pure_path.is_file():
+            await self._load_keras_h5(pure_path)
+            self._model_file_bytes = pure_path.stat().st_size
+        elif pure_path.suffix in _TORCH_SUFFIXES and pure_path.is_file():
+            await self._load_pytorch(pure_path)
+        # Other formats are simulated: in a real scenario, we would load TensorFlow/PyTorch here.
         # pure_path = Path(path)
         # if pure_path.exists():
         #     # Load logic...
@@ -51,7 +157,8 @@ class ImageClassifier(BaseModel):
         Run classification on preprocessed image.
 
         Args:
-            data: Preprocessed image array (normalized, correct shape) or path for demo
+            data: Preprocessed image array (normalized, correct shape),
+                encoded image bytes, or path / EncodedImage (by filename) for demo
 
         Returns:
             Dict with prediction, confidence, and metadata
@@ -59,45 +166,90 @@ class ImageClassifier(BaseModel):
         if not hasattr(self, "_is_loaded") or not self._is_loaded:
             raise RuntimeError("Model not loaded")
 
-        # MOCK IMPLEMENTATION FOR DEMO
-        # In a real scenario: model.predict(data)
-        
-        # Determine "prediction" based on input filename if it's a string (for demo)
-        prediction = "unknown_product"
-        confidence = 0.85
-        
-        if isinstance(data, str):
-            if "milk" in data.lower() or "leche" in data.lower():
-                prediction = "Leche Entera 1L"
-                confidence = 0.98
-            elif "coffee" in data.lower() or "cafe" in data.lower():
-                prediction = "Café Molido Premium"
-                confidence = 0.95
-            elif "cereal" in data.lower():
-                prediction = "Cereal Avena"
-                confidence = 0.92
+        if self._model is None:
+            # No backend loaded: demo result for any input, arrays included
+            return self._classify(data)
+
+        if isinstance(data, np.ndarray):
+            if data.shape != self.input_shape:
+                raise ValueError(f"Expected input shape {self.input_shape}, got {data.shape}")
+            # Batch of one as a view (no copy) through the tensor path
+            batch = await self.predict_batch(data[np.newaxis])
+            return {
+                "prediction": batch["predictions"][0],
+                "confidence": batch["confidences"].item(0),
+                "class_id": batch["class_ids"].item(0),
+                "metadata": batch["metadata"],
+            }
+
+        return self._classify(data)
+
+    async def predict_batch(
+        self, data_list: list[Any]
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """
+        Optimized batch prediction.
 
+        Image arrays are stacked into one (N, H, W, C) tensor and sent to
+        the backend in a single call (one launch instead of N); the demo
+        path/bytes inputs are classified in one pass without a tensor.
+
+        Args:
+            data_list: List of preprocessed images, or an already stacked
+                (N, H, W, C) array (ImagePreprocessor.process_batch output)
+
+        Returns:
+            Columnar results (predictions, confidences, class_ids, metadata)
+            for image tensors; a list of prediction dicts for demo inputs
+            or when no backend is loaded
+        """
+        if not hasattr(self, "_is_loaded") or not self._is_loaded:
+            raise RuntimeError("Model not loaded")
+
+        if self._model is None:
+            # No backend loaded: demo results, one per input
+            return [self._classify(data) for data in data_list]
+
+        if not isinstance(data_list, np.ndarray):
+            if all(isinstance(data, (str, bytes, EncodedImage)) for data in data_list):
+                return [self._classify(data) for data in data_list]
+            # Raises ValueError if the images don't share one shape
+            data_list = np.stack(data_list)
+
+        scores = self._predict_tensor(data_list)
+        class_ids = scores.argmax(axis=1)
+        confidences = scores[np.arange(len(scores)), class_ids]
+
+        labels = self._class_labels
         return {
-            "prediction": prediction,
-            "confidence": confidence,
-            "class_id": 0,  # Dummy ID
-            "metadata": {"model_version": "1.0.0"}
+            "predictions": [
+                labels[class_id] if class_id < len(labels) else str(class_id)
+                for class_id in class_ids.tolist()
+            ],
+            "confidences": confidences,
+            "class_ids": class_ids,
+            "metadata": {"model_version": "1.0.0"},
         }
 
-    async def predict_batch(self, data_list: list[Any]) -> list[dict[str, Any]]:
+    def _predict_tensor(self, batch: np.ndarray) -> np.ndarray:
         """
-        Optimized batch prediction.
+        Run the loaded backend once on a whole batch.
 
         Args:
-            data_list: List of preprocessed images
+            batch: Preprocessed images, shape (N, H, W, C)
 
         Returns:
-            List of prediction results
+            Class scores, shape (N, num_classes)
         """
-        results = []
-        for data in data_list:
-            results.append(await self.predict(data))
-        return results
+        if self._model is None:
+            raise RuntimeError("No model backend loaded for tensor input")
+
+        # Keras model.predict / wrapped PyTorch module / ONNX session.run
+        return np.asarray(self._model.predict(batch))
+
+    # Classify a single input (synchronous core shared by predict/predict_batch).
+    # MOCK IMPLEMENTATION FOR DEMO - in a real scenario: model.predict(data)
+    _classify = staticmethod(_build_demo_classifier(_DEMO_RULES))
 
     def set_class_labels(self, labels: list[str]) -> None:
         """
@@ -112,10 +264,36 @@ class ImageClassifier(BaseModel):
         """Get configured class labels."""
         return self._class_labels
 
+    async def unload(self) -> None:
+        """Release model and weight handles."""
+        if hasattr(self._weights_handle, "close"):
+            self._weights_handle.close()  # h5py.File
+        self._weights_handle = None
+        self._model_file_bytes = 0
+        await super().unload()
+
     async def _load_keras_h5(self, path: Path) -> None:
-        """Load Keras H5 model."""
-        # Here your code for loading Keras H5 model
-        pass
+        """
+        Load Keras H5 model.
+
+        Small files are read into memory in one go (h5py core driver, never
+        written back); larger ones stay on disk and are read as Keras needs
+        each dataset, instead of being copied whole into RAM first.
+        """
+        import h5py  # Optional dependency of the ML module
+        from tensorflow import keras
+
+        driver = (
+            {"driver": "core", "backing_store": False}
+            if path.stat().st_size <= _H5_IN_MEMORY_BYTES
+            else {}
+        )
+
+        def read() -> tuple[Any, Any]:
+            handle = h5py.File(path, "r", **driver)
+            return handle, keras.models.load_model(handle, compile=False)
+
+        self._weights_handle, self._model = await asyncio.to_thread(read)
 
     async def _load_keras_json_weights(self, json_path: Path) -> None:
         """Load Keras model from JSON architecture + H5 weights."""
@@ -123,11 +301,55 @@ class ImageClassifier(BaseModel):
         pass
 
     async def _load_pytorch(self, path: Path) -> None:
-        """Load PyTorch model."""
-        # Here your code for loading PyTorch model
-        pass
+        """
+        Load PyTorch weights, memory-mapped.
+
+        Tensors are backed by the file's pages (faulted in on first use and
+        shared between worker processes through the page cache) rather
+        than read and copied up front. The state dict is kept in
+        self._weights_handle; a subclass defining the architecture applies
+        it with module.load_state_dict(self._weights_handle, assign=True),
+        which keeps the mapped storage instead of copying it.
+        """
+        if path.suffix == ".safetensors":
+            from safetensors.torch import load_file  # Optional dependency of the ML module
+
+            self._weights_handle = await asyncio.to_thread(load_file, path)
+            return
+
+        import torch  # Optional dependency of the ML module
+
+        self._weights_handle = await asyncio.to_thread(
+            torch.load, path, map_location="cpu", mmap=True, weights_only=True
+        )
 
     async def _load_onnx(self, path: Path) -> None:
-        """Load ONNX model."""
-        # Here your code for loading ONNX model
-        pass
+        """
+        Load ONNX model into an ONNX Runtime session.
+
+        Prefers the TensorRT execution provider, building the engine at
+        self.precision (fp16/int8 use Tensor Cores). Built engines are cached
+        in `{path}.trt/` (ONNX Runtime keys them by GPU compute capability),
+        so restarts skip the build. Falls back to CUDA, then CPU.
+        """
+        import onnxruntime as ort  # Optional dependency of the ML module
+
+        trt_options = {
+            "trt_fp16_enable": self.precision in ("fp16", "int8"),
+            # int8 also needs a calibration table next to the engine cache
+            "trt_int8_enable": self.precision == "int8",
+            "trt_engine_cache_enable": True,
+            "trt_engine_cache_path": f"{path}.trt",
+        }
+        available = ort.get_available_providers()
+        providers = [
+            (name, trt_options) if name == "TensorrtExecutionProvider" else name
+            for name in _ONNX_PROVIDERS
+            if name in available
+        ]
+
+        # Session creation (and a TensorRT engine build) blocks for a while
+        session = await asyncio.to_thread(
+            ort.InferenceSession, str(path), providers=providers
+        )
+        self._model = _OnnxBackend(session)
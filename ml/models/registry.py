@@ -5,6 +5,10 @@ Manages ML model registration, loading, and lifecycle.
 Follows MLflow registry pattern for model management.
 """
 
+import asyncio
+import contextlib
+from collections import Counter, OrderedDict, defaultdict
+from collections.abc import AsyncIterator
 from typing import Any
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -41,14 +45,37 @@ class ModelRegistry:
     Provides:
     - Model registration with metadata
     - Lazy loading (models loaded on first use)
-    - In-memory caching (singleton per model)
+    - In-memory caching (singleton per model, least recently used evicted
+      once no caller is using it)
     - Version and stage management
     """
 
-    def __init__(self) -> None:
-        """Initialize empty registry."""
+    def __init__(
+        self,
+        max_loaded: int | None = None,
+        max_vram_gb: float | None = None,
+    ) -> None:
+        """
+        Initialize empty registry.
+
+        Args:
+            max_loaded: Maximum models kept loaded (None = unbounded)
+            max_vram_gb: Budget for the sum of BaseModel.memory_bytes
+                (None = unbounded)
+        """
+        self.max_loaded = max_loaded
+        self.max_bytes = int(max_vram_gb * 1024**3) if max_vram_gb else None
+
         self._registry: dict[str, ModelInfo] = {}
-        self._loaded_models: dict[str, BaseModel] = {}
+        # Stage -> registered model names, so list_models(stage) skips a full scan
+        # (dict keys as an insertion-ordered set: listings keep registration order)
+        self._by_stage: defaultdict[ModelStage, dict[str, None]] = defaultdict(dict)
+        # Least recently used first
+        self._loaded_models: OrderedDict[str, BaseModel] = OrderedDict()
+        # Per-model load locks: concurrent cold loads of one model share one load
+        self._load_locks: dict[str, asyncio.Lock] = {}
+        # Model name -> callers inside acquire(); models in use are never evicted
+        self._in_use: Counter[str] = Counter()
 
     def register(
         self,
@@ -70,6 +97,9 @@ class ModelRegistry:
             version: Model version string
             metadata: Additional model metadata
         """
+        if name in self._registry:
+            self._by_stage[self._registry[name].stage].pop(name, None)
+        self._by_stage[stage][name] = None
         self._registry[name] = ModelInfo(
             name=name,
             model_class=model_class,
@@ -89,7 +119,26 @@ class ModelRegistry:
         if name in self._loaded_models:
             self._loaded_models.pop(name)
         if name in self._registry:
-            self._registry.pop(name)
+            self._by_stage[self._registry.pop(name).stage].pop(name, None)
+
+    def set_stage(self, name: str, stage: ModelStage) -> None:
+        """
+        Move a registered model to another lifecycle stage.
+
+        Args:
+            name: Model identifier
+            stage: New lifecycle stage
+
+        Raises:
+            KeyError: If model not registered
+        """
+        if name not in self._registry:
+            raise KeyError(f"Model '{name}' not found in registry")
+
+        info = self._registry[name]
+        self._by_stage[info.stage].pop(name, None)
+        self._by_stage[stage][name] = None
+        info.stage = stage
 
     async def load(self, name: str) -> BaseModel:
         """
@@ -108,17 +157,87 @@ class ModelRegistry:
             raise KeyError(f"Model '{name}' not found in registry")
 
         if name in self._loaded_models:
+            self._loaded_models.move_to_end(name)
             return self._loaded_models[name]
 
-        info = self._registry[name]
-        
-        # Instantiate and load
-        model_instance = info.model_class()
-        await model_instance.load(info.model_path)
-        
-        # Cache
-        self._loaded_models[name] = model_instance
-        return model_instance
+        # setdefault is atomic on the event loop (no await in between)
+        async with self._load_locks.setdefault(name, asyncio.Lock()):
+            # Another caller may have finished loading while we waited
+            if name in self._loaded_models:
+                return self._loaded_models[name]
+
+            info = self._registry[name]
+
+            # Instantiate and load
+            model_instance = info.model_class()
+            if "precision" in info.metadata:
+                model_instance.precision = info.metadata["precision"]
+            await model_instance.load(info.model_path)
+            await model_instance.warmup()
+
+            # Cache
+            self._loaded_models[name] = model_instance
+            await self._evict_over_budget()
+            return model_instance
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, name: str) -> AsyncIterator[BaseModel]:
+        """
+        Load a model and keep it loaded while the block runs.
+
+        Eviction skips models with callers inside acquire(), so a model is
+        never unloaded under an in-flight prediction; if the registry is
+        over budget, the eviction is retried when the last caller leaves.
+
+        Args:
+            name: Model identifier
+
+        Yields:
+            Loaded model instance
+
+        Raises:
+            KeyError: If model not registered
+        """
+        # Pinned before loading: evictions run by concurrent loads skip it
+        self._in_use[name] += 1
+        try:
+            yield await self.load(name)
+        finally:
+            self._in_use[name] -= 1
+            if not self._in_use[name]:
+                del self._in_use[name]
+            await self._evict_over_budget()
+
+    def _over_budget(self) -> bool:
+        """Whether the loaded models exceed max_loaded or max_bytes."""
+        return (
+            self.max_loaded is not None and len(self._loaded_models) > self.max_loaded
+        ) or (
+            self.max_bytes is not None
+            and sum(m.memory_bytes for m in self._loaded_models.values()) > self.max_bytes
+        )
+
+    async def _evict_over_budget(self) -> None:
+        """
+        Unload least recently used idle models until within budget.
+
+        The most recently used model and models in use are never evicted;
+        if only those remain, the registry stays over budget for now.
+        """
+        while self._over_budget():
+            idle = next(
+                (
+                    name
+                    for name in list(self._loaded_models)[:-1]
+                    if not self._in_use[name]
+                ),
+                None,
+            )
+            if idle is None:
+                return
+            # Removed before the await: concurrent loads see it as unloaded
+            evicted = self._loaded_models.pop(idle)
+            await evicted.unload()
 
     async def unload(self, name: str) -> None:
         """
@@ -167,7 +286,7 @@ class ModelRegistry:
         """
         if stage is None:
             return list(self._registry.values())
-        return [m for m in self._registry.values() if m.stage == stage]
+        return [self._registry[name] for name in self._by_stage[stage]]
 
     def is_loaded(self, name: str) -> bool:
         """
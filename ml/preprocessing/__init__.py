@@ -1,6 +1,17 @@
 """Preprocessing module for data transformation pipelines."""
 
 from business_backend.ml.preprocessing.base import BasePreprocessor
-from business_backend.ml.preprocessing.image_preprocessor import ImagePreprocessor
+from business_backend.ml.preprocessing.gpu_image_preprocessor import GPUImagePreprocessor
+from business_backend.ml.preprocessing.image_preprocessor import (
+    EncodedImage,
+    ImagePreprocessor,
+    create_image_preprocessor,
+)
 
-__all__ = ["BasePreprocessor", "ImagePreprocessor"]
+__all__ = [
+    "BasePreprocessor",
+    "EncodedImage",
+    "GPUImagePreprocessor",
+    "ImagePreprocessor",
+    "create_image_preprocessor",
+]
@@ -0,0 +1,139 @@
+"""
+GPU Image Preprocessor.
+
+ImagePreprocessor variant that only decodes on the CPU and runs
+resize + normalization on the GPU with PyTorch.
+"""
+
+import asyncio
+from typing import Any
+
+import numpy as np
+
+from business_backend.ml.preprocessing.image_preprocessor import (
+    _COLOR_MODES,
+    ImageConfig,
+    ImagePreprocessor,
+)
+
+
+class GPUImagePreprocessor(ImagePreprocessor):
+    """
+    Image preprocessing with resize/normalize on the GPU.
+
+    Decoded images cross to the device as uint8 (4x fewer bytes than
+    float32) from pinned memory, asynchronously; interpolation and
+    normalization then run as batched tensor ops.
+
+    The pinned staging buffer is allocated once and reused across calls
+    (grown only when a batch needs more bytes), so steady-state batches
+    pay no page-locked allocation.
+
+    Output matches ImagePreprocessor (float32 NumPy arrays in HWC layout),
+    so it feeds the same models; waits on the device run in worker threads,
+    off the event loop.
+
+    Select it with ImageConfig(device="cuda") and create_image_preprocessor().
+    """
+
+    def __init__(self, config: ImageConfig | None = None) -> None:
+        """
+        Initialize processor with config.
+
+        Args:
+            config: Image preprocessing configuration (device must be a GPU)
+        """
+        super().__init__(config or ImageConfig(device="cuda"))
+        self._staging: Any = None  # Pinned uint8 torch tensor
+        self._staging_released: Any = None  # CUDA event after the last H2D copies
+
+    async def process(self, data: Any) -> Any:
+        """
+        Process a single image on the GPU.
+
+        Args:
+            data: Input image (base64, bytes, path, array, PIL)
+
+        Returns:
+            Preprocessed numpy array (height, width, channels)
+        """
+        return (await self.process_batch([data]))[0]
+
+    async def process_batch(self, data_list: list[Any]) -> Any:
+        """
+        Process batch of images on the GPU.
+
+        Args:
+            data_list: List of images in any supported format
+
+        Returns:
+            Stacked numpy array (batch_size, height, width, channels)
+        """
+        import torch  # Optional dependency of the ML module
+        import torch.nn.functional as F
+
+        pil_mode, channels = _COLOR_MODES[self.config.color_mode]
+        width, height = self.config.target_size
+        device = torch.device(self.config.device)
+
+        decoded = [
+            np.asarray(self._decode_image(data, pil_mode)) for data in data_list
+        ]
+        staging = await self._get_staging(sum(pixels.nbytes for pixels in decoded))
+        staging_view = staging.numpy()
+
+        resized = []
+        offset = 0
+        for pixels in decoded:
+            # Decoded sizes differ, so each image is resized before batching
+            end = offset + pixels.nbytes
+            staging_view[offset:end] = pixels.reshape(-1)
+            host = staging[offset:end].view(*pixels.shape[:2], channels)
+            offset = end
+
+            image = host.to(device, non_blocking=True)
+            image = image.permute(2, 0, 1).unsqueeze(0).float()
+            resized.append(
+                F.interpolate(
+                    image, size=(height, width), mode="bilinear", align_corners=False
+                )
+            )
+
+        if device.type == "cuda":
+            # The staging buffer may be reused once these copies complete
+            self._staging_released = torch.cuda.Event()
+            self._staging_released.record()
+
+        batch = torch.cat(resized)
+        if self.config.normalize:
+            low, high = self.config.normalize_range
+            batch.mul_((high - low) / 255.0)
+            if low:
+                batch.add_(low)
+
+        # Back to the host in the models' NHWC layout; the copy waits for the
+        # GPU work, so it runs in a worker thread
+        nhwc = batch.permute(0, 2, 3, 1).contiguous()
+        return await asyncio.to_thread(lambda: nhwc.cpu().numpy())
+
+    async def _get_staging(self, nbytes: int) -> Any:
+        """
+        Get the pinned staging buffer, with room for at least `nbytes`.
+
+        Waits (in a worker thread) for the previous batch's asynchronous
+        copies out of the buffer before handing it out again.
+        """
+        import torch  # Optional dependency of the ML module
+
+        # Re-checked after every wait: a concurrent batch may have taken the
+        # buffer and recorded a new event meanwhile. No await follows the
+        # loop, so the buffer is filled before anyone else can reuse it.
+        while (released := self._staging_released) is not None:
+            if not released.query():
+                await asyncio.to_thread(released.synchronize)
+            if self._staging_released is released:
+                self._staging_released = None
+
+        if self._staging is None or self._staging.numel() < nbytes:
+            self._staging = torch.empty(nbytes, dtype=torch.uint8, pin_memory=True)
+        return self._staging
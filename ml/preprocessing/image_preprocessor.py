@@ -8,21 +8,54 @@ Handles image preprocessing for ML models:
 - Color mode conversion
 """
 
-from typing import Any
+import base64
+import functools
+import io
+from typing import Any, NamedTuple
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
 from business_backend.ml.preprocessing.base import BasePreprocessor
 
+# color_mode -> (PIL mode, channels)
+_COLOR_MODES: dict[str, tuple[str, int]] = {
+    "rgb": ("RGB", 3),
+    "grayscale": ("L", 1),
+    "rgba": ("RGBA", 4),
+}
+
+_JPEG_MAGIC = b"\xff\xd8\xff"
+
+
+@functools.cache
+def _turbojpeg() -> Any | None:
+    """libjpeg-turbo (SIMD) decoder, or None when PyTurboJPEG is unavailable."""
+    try:
+        from turbojpeg import TurboJPEG  # Optional dependency of the ML module
+
+        return TurboJPEG()
+    except (ImportError, OSError):  # Package or native library missing
+        return None
+
+
+class EncodedImage(NamedTuple):
+    """Encoded image bytes plus the name they were uploaded under."""
+
+    data: bytes
+    filename: str | None = None
+
 
 @dataclass
 class ImageConfig:
     """Configuration for image preprocessing."""
 
-    target_size: tuple[int, int] = (224, 224)
+    target_size: tuple[int, int] = (224, 224)  # (width, height), PIL order
     normalize: bool = True
     normalize_range: tuple[float, float] = (0.0, 1.0)
     color_mode: str = "rgb"  # rgb, grayscale, rgba
+    device: str = "cpu"  # "cuda" runs resize/normalize on the GPU (PyTorch)
 
 
 class ImagePreprocessor(BasePreprocessor):
@@ -31,7 +64,7 @@ class ImagePreprocessor(BasePreprocessor):
 
     Supports multiple input formats:
     - Base64 encoded string (data:image/png;base64,...)
-    - Raw bytes
+    - Raw bytes (or EncodedImage)
     - File path
     - NumPy array
     - PIL Image
@@ -56,27 +89,134 @@ class ImagePreprocessor(BasePreprocessor):
         Returns:
             Preprocessed numpy array ready for model input
         """
-        # Here your code for:
-        # 1. Detect input type (base64, bytes, path, PIL, numpy)
-        # 2. Convert to PIL Image
-        # 3. Resize to target_size
-        # 4. Convert color mode (rgb, grayscale, rgba)
-        # 5. Convert to numpy array
-        # 6. Normalize if enabled
-        pass
+        pil_mode, channels = _COLOR_MODES[self.config.color_mode]
+        width, height = self.config.target_size
+
+        out = np.empty((height, width, channels), dtype=np.float32)
+        return self._to_float_into(self._load_image(data, pil_mode), out)
 
     async def process_batch(self, data_list: list[Any]) -> list[Any]:
         """
         Process batch of images.
 
+        Each image is decoded, resized and normalized straight into its
+        slot of one preallocated (N, H, W, C) float32 buffer: no per-image
+        intermediate arrays and no np.stack copy.
+
         Args:
             data_list: List of images in any supported format
 
         Returns:
             Stacked numpy array (batch_size, height, width, channels)
         """
-        # Here your code for batch image processing
-        pass
+        pil_mode, channels = _COLOR_MODES[self.config.color_mode]
+        width, height = self.config.target_size
+
+        batch = np.empty((len(data_list), height, width, channels), dtype=np.float32)
+        for i, data in enumerate(data_list):
+            self._to_float_into(self._load_image(data, pil_mode), batch[i])
+
+        return batch
+
+    def _to_float_into(self, image: Any, out: np.ndarray) -> np.ndarray:
+        """
+        Write a decoded image into a float32 (H, W, C) buffer.
+
+        The uint8 -> float32 cast and the rescale to normalize_range are
+        fused into a single ufunc pass over the pixels.
+
+        Args:
+            image: PIL Image already resized to config.target_size
+            out: Destination float32 array (may be a view into a batch)
+
+        Returns:
+            `out`
+        """
+        src = np.asarray(image).reshape(out.shape)
+
+        if not self.config.normalize:
+            np.copyto(out, src)
+            return out
+
+        low, high = self.config.normalize_range
+        np.multiply(src, (high - low) / 255.0, out=out, dtype=np.float32)
+        if low:
+            np.add(out, low, out=out)
+        return out
+
+    def _load_image(self, data: Any, pil_mode: str) -> Any:
+        """
+        Decode any supported input to a PIL Image in `pil_mode`, resized.
+
+        Args:
+            data: Input image (base64 data URL, bytes, path, array, PIL)
+            pil_mode: Target PIL color mode
+
+        Returns:
+            PIL Image of config.target_size
+        """
+        from PIL import Image  # Optional dependency of the ML module
+
+        return self._decode_image(data, pil_mode).resize(
+            self.config.target_size, Image.BILINEAR
+        )
+
+    def _decode_image(self, data: Any, pil_mode: str) -> Any:
+        """
+        Decode any supported input to a PIL Image in `pil_mode` (original size).
+
+        Args:
+            data: Input image (base64 data URL, bytes, path, array, PIL)
+            pil_mode: Target PIL color mode
+
+        Returns:
+            PIL Image
+        """
+        from PIL import Image  # Optional dependency of the ML module
+
+        if isinstance(data, Image.Image):
+            image = data
+        elif isinstance(data, np.ndarray):
+            image = Image.fromarray(data)
+        elif isinstance(data, EncodedImage):
+            image = self._decode_bytes(data.data, pil_mode)
+        elif isinstance(data, (bytes, bytearray)):
+            image = self._decode_bytes(data, pil_mode)
+        elif isinstance(data, str) and data.startswith("data:"):
+            image = self._decode_bytes(base64.b64decode(data.split(",", 1)[1]), pil_mode)
+        else:
+            image = Image.open(data)  # File path
+
+        if image.mode != pil_mode:
+            image = image.convert(pil_mode)
+        return image
+
+    def _decode_bytes(self, raw: bytes | bytearray, pil_mode: str) -> Any:
+        """
+        Decode encoded image bytes to a PIL Image.
+
+        JPEGs go through libjpeg-turbo's SIMD decoder straight to the
+        target color mode when PyTurboJPEG is installed; everything else
+        (and JPEGs without it) goes through PIL.
+
+        Args:
+            raw: Encoded image bytes
+            pil_mode: Target PIL color mode
+
+        Returns:
+            PIL Image
+        """
+        from PIL import Image  # Optional dependency of the ML module
+
+        jpeg = _turbojpeg()
+        if jpeg is not None and raw[:3] == _JPEG_MAGIC:
+            from turbojpeg import TJPF_GRAY, TJPF_RGB, TJPF_RGBA
+
+            pixel_format = {"RGB": TJPF_RGB, "L": TJPF_GRAY, "RGBA": TJPF_RGBA}[pil_mode]
+            pixels = jpeg.decode(bytes(raw), pixel_format=pixel_format)
+            return Image.fromarray(pixels.squeeze(axis=2) if pil_mode == "L" else pixels)
+
+        return Image.open(io.BytesIO(raw))
 
     def validate(self, data: Any) -> bool:
         """
@@ -101,8 +241,9 @@ class ImagePreprocessor(BasePreprocessor):
         Returns:
             PIL Image
         """
-        # Here your code for base64 decoding
-        pass
+        encoded = data_url.split(",", 1)[1] if data_url.startswith("data:") else data_url
+        pil_mode, _ = _COLOR_MODES[self.config.color_mode]
+        return self._decode_bytes(base64.b64decode(encoded), pil_mode)
 
     async def to_base64(self, image: Any, format: str = "PNG") -> str:
         """
@@ -131,3 +272,24 @@ class ImagePreprocessor(BasePreprocessor):
         """
         # Here your code for saving image to disk
         pass
+
+
+def create_image_preprocessor(config: ImageConfig | None = None) -> ImagePreprocessor:
+    """
+    Create the image preprocessor for a config's device.
+
+    Args:
+        config: Image preprocessing configuration
+
+    Returns:
+        GPUImagePreprocessor for non-CPU devices, ImagePreprocessor otherwise
+    """
+    config = config or ImageConfig()
+    if config.device == "cpu":
+        return ImagePreprocessor(config)
+
+    from business_backend.ml.preprocessing.gpu_image_preprocessor import (
+        GPUImagePreprocessor,
+    )
+
+    return GPUImagePreprocessor(config)
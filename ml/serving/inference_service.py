@@ -5,14 +5,16 @@ Generic service for running ML model inference.
 Orchestrates preprocessing, prediction, and postprocessing pipeline.
 """
 
+import asyncio
 from typing import Any
 from dataclasses import dataclass
 
+from business_backend.ml.models.base import BaseModel
 from business_backend.ml.models.registry import ModelRegistry
 from business_backend.ml.preprocessing.base import BasePreprocessor
 
 
-@dataclass
+@dataclass(slots=True)
 class PredictionResult:
     """Result from ML inference."""
 
@@ -40,6 +42,8 @@ class InferenceService:
         self,
         model_registry: ModelRegistry,
         preprocessor: BasePreprocessor | None = None,
+        max_batch_size: int = 32,
+        max_concurrency: int = 32,
     ) -> None:
         """
         Initialize inference service.
@@ -47,9 +51,20 @@ class InferenceService:
         Args:
             model_registry: Registry for loading models
             preprocessor: Optional preprocessor for input data
+            max_batch_size: Batch size that flushes a coalescing window early
+            max_concurrency: Chunks of one predict_batch() call in flight at once
         """
         self.registry = model_registry
         self.preprocessor = preprocessor
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+
+        # Created on first use, inside the running event loop
+        self._semaphore: asyncio.Semaphore | None = None
+
+        # Open coalescing windows: (model_name, preprocess) -> [(data, future)]
+        self._pending: dict[tuple[str, bool], list[tuple[Any, asyncio.Future]]] = {}
+        self._tasks: set[asyncio.Task] = set()
 
     async def predict(
         self,
@@ -62,22 +77,22 @@ class InferenceService:
 
         Args:
             model_name: Name of registered model
-            data: Input data (raw or preprocessed)
+            data: Input data (raw or preprocessed). Raw images may be passed
+                as a file path (str) or as encoded bytes already in memory.
             preprocess: Whether to run preprocessing
 
         Returns:
             PredictionResult with prediction and metadata
         """
-        # 1. Load model from registry
-        model = await self.registry.load(model_name)
-        
-        # 2. Preprocess data if enabled and preprocessor available
-        input_data = data
-        if preprocess and self.preprocessor:
-            input_data = await self.preprocessor.process(data)
-            
-        # 3. Run model.predict()
-        result = await model.predict(input_data)
+        # 1. Load model from registry (kept loaded until the prediction ends)
+        async with self.registry.acquire(model_name) as model:
+            # 2. Preprocess data if enabled and preprocessor available
+            input_data = data
+            if preprocess and self.preprocessor:
+                input_data = await self.preprocessor.process(data)
+
+            # 3. Run model.predict()
+            result = await model.predict(input_data)
         
         # 4. Format and return PredictionResult
         prediction_value = result.get("prediction")
@@ -96,26 +111,133 @@ class InferenceService:
         model_name: str,
         data_list: list[Any],
         preprocess: bool = True,
+        chunk_size: int | None = None,
     ) -> list[PredictionResult]:
         """
         Run batch inference.
 
+        With `chunk_size`, the input is split into chunks that are run
+        concurrently (up to max_concurrency in flight), which hides the
+        latency of remote model backends. When preprocessing, chunks are
+        pipelined: chunk k is preprocessed while chunk k-1 is inferred.
+
         Args:
             model_name: Name of registered model
             data_list: List of input data items
             preprocess: Whether to run preprocessing
+            chunk_size: Items per model call (None = one call for everything)
 
         Returns:
-            List of PredictionResults
+            List of PredictionResults, in input order
         """
-        model = await self.registry.load(model_name)
-        
+        async with self.registry.acquire(model_name) as model:
+            if not chunk_size or len(data_list) <= chunk_size:
+                return await self._predict_chunk(model_name, model, data_list, preprocess)
+
+            chunks = [
+                data_list[i : i + chunk_size] for i in range(0, len(data_list), chunk_size)
+            ]
+            if preprocess and self.preprocessor:
+                return await self._predict_pipelined(model_name, model, chunks)
+
+            semaphore = self._get_semaphore()
+
+            async def run(chunk: list[Any]) -> list[PredictionResult]:
+                async with semaphore:
+                    return await self._predict_chunk(model_name, model, chunk, preprocess)
+
+            chunk_results = await asyncio.gather(*(run(chunk) for chunk in chunks))
+            return [result for results in chunk_results for result in results]
+
+    async def _predict_pipelined(
+        self,
+        model_name: str,
+        model: BaseModel,
+        chunks: list[list[Any]],
+    ) -> list[PredictionResult]:
+        """
+        Overlap preprocessing and inference across chunks.
+
+        A producer preprocesses chunks into a small bounded queue; the
+        consumer starts inference on each preprocessed chunk as soon as
+        a concurrency slot is free. Both sides apply backpressure.
+
+        If any step fails (or the caller is cancelled), the producer and
+        every inference task still running are cancelled before the
+        error propagates.
+        """
+        preprocessor = self.preprocessor
+        assert preprocessor is not None
+
+        # Created here, inside the running loop (not in __init__)
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=2)
+        done = object()
+
+        async def produce() -> None:
+            try:
+                for chunk in chunks:
+                    await queue.put(await preprocessor.process_batch(chunk))
+            except Exception:
+                # Wake the consumer; the error is re-raised by `await producer`
+                await queue.put(done)
+                raise
+            await queue.put(done)
+
+        semaphore = self._get_semaphore()
+        failures: list[BaseException] = []
+
+        def on_chunk_done(task: asyncio.Task) -> None:
+            semaphore.release()
+            if not task.cancelled() and task.exception() is not None:
+                failures.append(task.exception())
+
+        producer = asyncio.create_task(produce())
+        tasks: list[asyncio.Task] = []
+        try:
+            while (processed := await queue.get()) is not done:
+                await semaphore.acquire()
+                if failures:
+                    semaphore.release()
+                    raise failures[0]
+                task = asyncio.create_task(
+                    self._predict_chunk(model_name, model, processed, False)
+                )
+                task.add_done_callback(on_chunk_done)
+                tasks.append(task)
+
+            await producer
+            chunk_results = await asyncio.gather(*tasks)
+        finally:
+            for task in (producer, *tasks):
+                task.cancel()  # No-op for tasks already done
+
+        return [result for results in chunk_results for result in results]
+
+    async def _predict_chunk(
+        self,
+        model_name: str,
+        model: BaseModel,
+        data_list: list[Any],
+        preprocess: bool,
+    ) -> list[PredictionResult]:
+        """Preprocess and predict one chunk with a single model call."""
         processed_list = data_list
         if preprocess and self.preprocessor:
             processed_list = await self.preprocessor.process_batch(data_list)
-            
+
         batch_results = await model.predict_batch(processed_list)
-        
+
+        if isinstance(batch_results, dict):
+            # Columnar results: walk the parallel arrays, no per-item dicts
+            metadata = batch_results.get("metadata")
+            return [
+                PredictionResult(model_name, prediction, confidence, metadata)
+                for prediction, confidence in zip(
+                    batch_results["predictions"],
+                    batch_results["confidences"].tolist(),
+                )
+            ]
+
         return [
             PredictionResult(
                 model_name=model_name,
@@ -126,6 +248,89 @@ class InferenceService:
             for res in batch_results
         ]
 
+    async def predict_coalesced(
+        self,
+        model_name: str,
+        data: Any,
+        preprocess: bool = True,
+        window_ms: float = 5.0,
+    ) -> PredictionResult:
+        """
+        Run inference on a single item, batched with concurrent callers.
+
+        Requests for the same model arriving within `window_ms` of each other
+        are grouped into one predict_batch() call (flushed early once
+        `max_batch_size` items are waiting).
+
+        Args:
+            model_name: Name of registered model
+            data: Input data (raw or preprocessed)
+            preprocess: Whether to run preprocessing
+            window_ms: How long the first request waits for others to join
+
+        Returns:
+            PredictionResult for `data`
+        """
+        key = (model_name, preprocess)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            self._spawn(self._flush_after(key, batch, window_ms / 1000))
+        batch.append((data, future))
+
+        if len(batch) >= self.max_batch_size:
+            del self._pending[key]
+            self._spawn(self._run_batch(key, batch))
+
+        return await future
+
+    async def _flush_after(
+        self,
+        key: tuple[str, bool],
+        batch: list[tuple[Any, asyncio.Future]],
+        delay: float,
+    ) -> None:
+        """Close the coalescing window after `delay` unless already flushed."""
+        await asyncio.sleep(delay)
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+            await self._run_batch(key, batch)
+
+    async def _run_batch(
+        self,
+        key: tuple[str, bool],
+        batch: list[tuple[Any, asyncio.Future]],
+    ) -> None:
+        """Run one predict_batch() call and resolve the waiting futures."""
+        model_name, preprocess = key
+        try:
+            results = await self.predict_batch(
+                model_name, [data for data, _ in batch], preprocess=preprocess
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Concurrency limit for chunked predict_batch() calls (created lazily)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _spawn(self, coro: Any) -> None:
+        """Start a background task, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
     def list_available_models(self) -> list[str]:
         """
         List all models available for inference.
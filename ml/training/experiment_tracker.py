@@ -5,11 +5,20 @@ Tracks ML experiments including parameters, metrics, and artifacts.
 Follows MLflow tracking pattern.
 """
 
+import json
+import time
+import uuid
 from typing import Any
 from dataclasses import dataclass
 from pathlib import Path
 from enum import Enum
 
+import numpy as np
+
+# Initial rows of a metric history buffer when the run length is unknown
+# (doubled when full)
+_METRIC_BUFFER_ROWS = 1024
+
 
 class RunStatus(str, Enum):
     """Status of an experiment run."""
@@ -44,6 +53,12 @@ class ExperimentTracker:
     - Metric logging (per step and final)
     - Artifact logging (models, plots, data)
 
+    Metric histories are kept as binary (step, value) float64 columns,
+    one growable array per metric, and saved as
+    `{artifact_location}/{experiment}/{run_id}/metrics/{key}.npy` when the
+    run ends (hierarchical keys such as "train/loss" become subdirectories).
+    Parameters are written to `{run_id}/params.json` as they are logged.
+
     Can be backed by:
     - Local filesystem (default)
     - MLflow
@@ -66,31 +81,65 @@ class ExperimentTracker:
         self.tracking_uri = tracking_uri
         self.artifact_location = Path(artifact_location) if artifact_location else None
         self._current_run: RunInfo | None = None
+        self._runs: dict[str, RunInfo] = {}
+        self._run_dir: Path | None = None
+
+        # Metric history of the current run: key -> (capacity, 2) [step, value]
+        self._metric_buffers: dict[str, np.ndarray] = {}
+        self._metric_counts: dict[str, int] = {}
+        self._metric_capacity = _METRIC_BUFFER_ROWS
 
     def start_run(
         self,
         experiment_name: str,
         run_name: str | None = None,
         tags: dict[str, str] | None = None,
+        expected_steps: int | None = None,
+        metric_names: list[str] | None = None,
     ) -> str:
         """
         Start a new experiment run.
 
+        With `expected_steps` (e.g. TrainConfig.expected_steps), metric
+        buffers are sized for the whole run up front, so logging never
+        reallocates unless the run goes longer than expected.
+
         Args:
             experiment_name: Name of the experiment
             run_name: Optional name for this run
             tags: Optional tags for the run
+            expected_steps: Expected number of values logged per metric
+            metric_names: Metrics whose buffers are allocated right away
 
         Returns:
             Run ID
         """
-        # Here your code for:
-        # 1. Create or get experiment by name
-        # 2. Generate run ID
-        # 3. Initialize RunInfo
-        # 4. Create run directory for artifacts
-        # 5. Return run ID
-        pass
+        if self._current_run is not None:
+            self.end_run()
+
+        run_id = uuid.uuid4().hex
+        self._current_run = RunInfo(
+            run_id=run_id,
+            experiment_name=experiment_name,
+            status=RunStatus.RUNNING,
+            start_time=time.time(),
+            params={},
+            metrics={},
+            artifacts=[],
+        )
+        self._runs[run_id] = self._current_run
+        self._metric_capacity = expected_steps or _METRIC_BUFFER_ROWS
+        self._metric_buffers = {
+            key: np.empty((self._metric_capacity, 2), dtype=np.float64)
+            for key in metric_names or ()
+        }
+        self._metric_counts = {}
+
+        if self.artifact_location is not None:
+            self._run_dir = self.artifact_location / experiment_name / run_id
+            self._run_dir.mkdir(parents=True, exist_ok=True)
+
+        return run_id
 
     def end_run(self, status: RunStatus = RunStatus.COMPLETED) -> None:
         """
@@ -99,8 +148,24 @@ class ExperimentTracker:
         Args:
             status: Final status of the run
         """
-        # Here your code for ending run
-        pass
+        run = self._current_run
+        if run is None:
+            return
+
+        if self._run_dir is not None and self._metric_buffers:
+            metrics_dir = self._run_dir / "metrics"
+            for key, buffer in self._metric_buffers.items():
+                count = self._metric_counts.get(key, 0)
+                path = metrics_dir / f"{key}.npy"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                np.save(path, buffer[:count])
+
+        run.status = status
+        run.end_time = time.time()
+        self._current_run = None
+        self._run_dir = None
+        self._metric_buffers = {}
+        self._metric_counts = {}
 
     def log_params(self, params: dict[str, Any]) -> None:
         """
@@ -108,9 +173,20 @@ class ExperimentTracker:
 
         Args:
             params: Dictionary of parameter names and values
+
+        Raises:
+            RuntimeError: If no run is active
         """
-        # Here your code for logging parameters
-        pass
+        run = self._current_run
+        if run is None:
+            raise RuntimeError("No active run")
+
+        run.params.update(params)
+        if self._run_dir is not None:
+            # Written right away: parameters survive a run that crashes
+            (self._run_dir / "params.json").write_text(
+                json.dumps(run.params, indent=2, sort_keys=True, default=str)
+            )
 
     def log_param(self, key: str, value: Any) -> None:
         """
@@ -119,9 +195,11 @@ class ExperimentTracker:
         Args:
             key: Parameter name
             value: Parameter value
+
+        Raises:
+            RuntimeError: If no run is active
         """
-        # Here your code for logging single parameter
-        pass
+        self.log_params({key: value})
 
     def log_metrics(self, metrics: dict[str, float], step: int | None = None) -> None:
         """
@@ -131,8 +209,8 @@ class ExperimentTracker:
             metrics: Dictionary of metric names and values
             step: Optional step number (epoch, iteration)
         """
-        # Here your code for logging metrics
-        pass
+        for key, value in metrics.items():
+            self.log_metric(key, value, step)
 
     def log_metric(self, key: str, value: float, step: int | None = None) -> None:
         """
@@ -141,10 +219,28 @@ class ExperimentTracker:
         Args:
             key: Metric name
             value: Metric value
-            step: Optional step number
+            step: Optional step number (defaults to the metric's call count)
+
+        Raises:
+            RuntimeError: If no run is active
         """
-        # Here your code for logging single metric
-        pass
+        run = self._current_run
+        if run is None:
+            raise RuntimeError("No active run")
+
+        count = self._metric_counts.get(key, 0)
+        buffer = self._metric_buffers.get(key)
+        if buffer is None:
+            buffer = np.empty((self._metric_capacity, 2), dtype=np.float64)
+            self._metric_buffers[key] = buffer
+        elif count == len(buffer):
+            grown = np.empty((2 * len(buffer), 2), dtype=np.float64)
+            grown[:count] = buffer
+            buffer = self._metric_buffers[key] = grown
+
+        buffer[count] = (count if step is None else step, value)
+        self._metric_counts[key] = count + 1
+        run.metrics[key] = value  # Latest value
 
     def log_artifact(self, local_path: str | Path, artifact_path: str | None = None) -> None:
         """
@@ -184,8 +280,7 @@ class ExperimentTracker:
         Returns:
             RunInfo or None if not found
         """
-        # Here your code for getting run info
-        pass
+        return self._runs.get(run_id)
 
     def list_runs(
         self,
@@ -202,8 +297,12 @@ class ExperimentTracker:
         Returns:
             List of RunInfo
         """
-        # Here your code for listing runs
-        pass
+        return [
+            run
+            for run in self._runs.values()
+            if run.experiment_name == experiment_name
+            and (status is None or run.status == status)
+        ]
 
     def get_best_run(
         self,
@@ -222,5 +321,13 @@ class ExperimentTracker:
         Returns:
             RunInfo of best run or None
         """
-        # Here your code for getting best run
-        pass
+        runs = [
+            run
+            for run in self.list_runs(experiment_name)
+            if run.metrics and metric in run.metrics
+        ]
+        if not runs:
+            return None
+
+        pick = max if maximize else min
+        return pick(runs, key=lambda run: run.metrics[metric])
@@ -5,12 +5,60 @@ Generic trainer for ML model training and evaluation.
 Supports training, evaluation, and checkpoint management.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterable, Iterator
 from typing import Any
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from business_backend.ml.models.base import BaseModel
-from business_backend.ml.training.experiment_tracker import ExperimentTracker
+from business_backend.ml.training.experiment_tracker import ExperimentTracker, RunStatus
+
+
+def _prefetch_to_device(batches: Iterable[Any], device: Any) -> Iterator[tuple[Any, Any]]:
+    """
+    Yield (inputs, targets) batches already on `device`.
+
+    On CUDA, batch k+1 is copied from pinned memory on a side stream
+    while batch k is being trained on, so host-to-device copies overlap
+    compute instead of running between steps.
+    """
+    import torch  # Optional dependency of the ML module
+
+    if device.type != "cuda":
+        for inputs, targets in batches:
+            yield inputs.to(device), targets.to(device)
+        return
+
+    copy_stream = torch.cuda.Stream(device)
+    compute_stream = torch.cuda.current_stream(device)
+
+    def copy(batch: tuple[Any, Any]) -> tuple[Any, ...]:
+        with torch.cuda.stream(copy_stream):
+            # Async H2D copies need page-locked sources (DataLoader pin_memory=True)
+            return tuple(
+                (t if t.is_pinned() else t.pin_memory()).to(device, non_blocking=True)
+                for t in batch
+            )
+
+    pending = None
+    for batch in batches:
+        if pending is not None:
+            ready = pending
+            compute_stream.wait_stream(copy_stream)
+            pending = copy(batch)  # Next copy starts before this batch is used
+            for t in ready:
+                t.record_stream(compute_stream)  # Allocated on copy_stream
+            yield ready
+        else:
+            pending = copy(batch)
+
+    if pending is not None:
+        compute_stream.wait_stream(copy_stream)
+        for t in pending:
+            t.record_stream(compute_stream)
+        yield pending
 
 
 @dataclass
@@ -24,6 +72,7 @@ class TrainConfig:
     early_stopping: bool = True
     early_stopping_patience: int = 5
     checkpoint_dir: str | Path = "checkpoints"
+    expected_steps: int | None = None  # Metric steps per run (sizes tracker buffers)
     extra_params: dict[str, Any] = field(default_factory=dict)
 
 
@@ -82,6 +131,17 @@ class Trainer:
         """
         Train model on data.
 
+        The model's PyTorch module is compiled with torch.compile
+        (mode="reduce-overhead": fused kernels, CUDA graphs), and the
+        forward pass runs under bf16 autocast on CUDA. `train_data` (and
+        `validation_data`) yield (inputs, targets) batches, e.g. a
+        DataLoader built with pin_memory=True, num_workers>=2 and
+        persistent_workers=True; batches are prefetched to the device one
+        step ahead. config.extra_params may set:
+        - accumulation_steps: Micro-batches per optimizer step (default 1)
+        - loss_fn: Loss module/callable (default CrossEntropyLoss)
+        - experiment_name: Tracker experiment (default: model class name)
+
         Args:
             model: Model to train (must have underlying trainable model)
             train_data: Training dataset (numpy, tf.data, DataLoader, etc.)
@@ -90,17 +150,133 @@ class Trainer:
 
         Returns:
             TrainResult with training history and final metrics
+
+        Raises:
+            TypeError: If the model has no PyTorch module to train
         """
-        # Here your code for:
-        # 1. Start experiment tracking if tracker available
-        # 2. Log training parameters
-        # 3. Setup callbacks (early stopping, checkpoints)
-        # 4. Run training loop
-        # 5. Log metrics per epoch
-        # 6. Save final checkpoint
-        # 7. End experiment tracking
-        # 8. Return TrainResult
-        pass
+        import torch  # Optional dependency of the ML module
+
+        module = model._model
+        if not isinstance(module, torch.nn.Module):
+            raise TypeError(f"{type(model).__name__} has no PyTorch module to train")
+
+        extra = config.extra_params
+        accumulation_steps = max(1, int(extra.get("accumulation_steps", 1)))
+        loss_fn = extra.get("loss_fn") or torch.nn.CrossEntropyLoss()
+        optimizer = torch.optim.AdamW(module.parameters(), lr=config.learning_rate)
+        device = next(module.parameters()).device
+        # The first steps include compilation; exclude them from any timing
+        compiled = torch.compile(module, mode="reduce-overhead")
+
+        if self.tracker is not None:
+            self.tracker.start_run(
+                extra.get("experiment_name", type(model).__name__),
+                expected_steps=config.expected_steps or config.epochs,
+                metric_names=["loss", "val_loss"],
+            )
+            self.tracker.log_params(
+                {
+                    "epochs": config.epochs,
+                    "batch_size": config.batch_size,
+                    "learning_rate": config.learning_rate,
+                    "accumulation_steps": accumulation_steps,
+                }
+            )
+
+        def forward_loss(inputs: Any, targets: Any) -> Any:
+            with torch.autocast(
+                device_type=device.type, dtype=torch.bfloat16, enabled=device.type == "cuda"
+            ):
+                return loss_fn(compiled(inputs), targets)
+
+        def train_epoch() -> float:
+            module.train()
+            optimizer.zero_grad(set_to_none=True)
+            # Summed on the device: no host sync per step
+            total = torch.zeros((), device=device)
+            batches = 0
+            for batches, (inputs, targets) in enumerate(
+                _prefetch_to_device(train_data, device), start=1
+            ):
+                loss = forward_loss(inputs, targets)
+                (loss / accumulation_steps).backward()
+                if batches % accumulation_steps == 0:
+                    optimizer.step()
+                    optimizer.zero_grad(set_to_none=True)
+                total += loss.detach()
+            if batches % accumulation_steps:
+                optimizer.step()  # Leftover micro-batches of the epoch
+                optimizer.zero_grad(set_to_none=True)
+            return total.item() / max(batches, 1)
+
+        def validate() -> float:
+            module.eval()
+            total = torch.zeros((), device=device)
+            batches = 0
+            with torch.inference_mode():
+                for batches, (inputs, targets) in enumerate(
+                    _prefetch_to_device(validation_data, device), start=1
+                ):
+                    total += forward_loss(inputs, targets)
+            return total.item() / max(batches, 1)
+
+        history: dict[str, list[float]] = {"loss": []}
+        if validation_data is not None:
+            history["val_loss"] = []
+        monitor = "val_loss" if validation_data is not None else "loss"
+        best_value = float("inf")
+        best_epoch: int | None = None
+        checkpoint_dir = Path(config.checkpoint_dir)
+
+        # Epochs block on the GPU/CPU, so they run off the event loop, always on
+        # the same thread (compiled CUDA graphs are recorded per thread)
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trainer")
+        status_ok = False
+        try:
+            for epoch in range(config.epochs):
+                epoch_metrics = {"loss": await loop.run_in_executor(executor, train_epoch)}
+                if validation_data is not None:
+                    epoch_metrics["val_loss"] = await loop.run_in_executor(
+                        executor, validate
+                    )
+
+                for key, value in epoch_metrics.items():
+                    history[key].append(value)
+                if self.tracker is not None:
+                    self.tracker.log_metrics(epoch_metrics, step=epoch)
+
+                if epoch_metrics[monitor] < best_value:
+                    best_value, best_epoch = epoch_metrics[monitor], epoch
+                    await self.save_checkpoint(
+                        model, checkpoint_dir / "best.pt", {"epoch": epoch, **epoch_metrics}
+                    )
+                elif (
+                    config.early_stopping
+                    and best_epoch is not None
+                    and epoch - best_epoch >= config.early_stopping_patience
+                ):
+                    break
+            status_ok = True
+        finally:
+            executor.shutdown(wait=False)
+            if self.tracker is not None:
+                self.tracker.end_run(RunStatus.COMPLETED if status_ok else RunStatus.FAILED)
+
+        epochs_completed = len(history["loss"])
+        final_metrics = {key: values[-1] for key, values in history.items() if values}
+        model_path = await self.save_checkpoint(
+            model, checkpoint_dir / "final.pt", {"epoch": epochs_completed - 1, **final_metrics}
+        )
+
+        return TrainResult(
+            model_path=model_path,
+            epochs_completed=epochs_completed,
+            final_loss=final_metrics.get("loss", float("nan")),
+            final_metrics=final_metrics,
+            history=history,
+            best_epoch=best_epoch,
+        )
 
     async def evaluate(
         self,
@@ -142,9 +318,29 @@ class Trainer:
 
         Returns:
             Path to saved checkpoint
+
+        Raises:
+            TypeError: If the model has no PyTorch module to save
         """
-        # Here your code for saving checkpoint
-        pass
+        import torch  # Optional dependency of the ML module
+
+        module = model._model
+        if not hasattr(module, "state_dict"):
+            raise TypeError(f"{type(model).__name__} has no PyTorch module to checkpoint")
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        checkpoint = {"state_dict": module.state_dict(), "metadata": metadata or {}}
+
+        def write() -> None:
+            # Write to a temporary file first so a crash never leaves a torn checkpoint
+            tmp_path = path.with_name(path.name + ".tmp")
+            torch.save(checkpoint, tmp_path)
+            tmp_path.replace(path)
+
+        # Serializing multi-GB state dicts blocks: keep it off the event loop
+        await asyncio.to_thread(write)
+        return path
 
     async def load_checkpoint(
         self,
@@ -160,9 +356,22 @@ class Trainer:
 
         Returns:
             Checkpoint metadata if available
+
+        Raises:
+            TypeError: If the model has no PyTorch module to load into
         """
-        # Here your code for loading checkpoint
-        pass
+        import torch  # Optional dependency of the ML module
+
+        module = model._model
+        if not hasattr(module, "load_state_dict"):
+            raise TypeError(f"{type(model).__name__} has no PyTorch module to load into")
+
+        # Memory-mapped and read off the event loop; tensors only (no pickled code)
+        checkpoint = await asyncio.to_thread(
+            torch.load, Path(path), map_location="cpu", mmap=True, weights_only=True
+        )
+        module.load_state_dict(checkpoint["state_dict"])
+        return checkpoint.get("metadata", {})
 
     async def fine_tune(
         self,
@@ -12,9 +12,13 @@ class ComputerService:
     def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
         self._session_factory = session_factory
 
-    async def get_all_computers(self) -> Sequence[Computer]:
+    async def get_all_computers(
+        self, limit: int = 500, offset: int = 0
+    ) -> Sequence[Computer]:
+        # Capped so a large table is never fetched whole by accident; ordered
+        # so consecutive pages neither skip nor repeat rows
         async with self._session_factory() as session:
-            stmt = select(Computer)
+            stmt = select(Computer).order_by(Computer.id).offset(offset).limit(limit)
             result = await session.execute(stmt)
             return result.scalars().all()
 
@@ -4,12 +4,21 @@ Product Service for Business Backend.
 Provides CRUD operations for ProductStock using SQLAlchemy ORM.
 """
 
+from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import any_, bindparam, func, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from business_backend.database.models import ProductStock
+from business_backend.domain.product_schemas import ProductStockSummary
+
+# Columns projected for ProductStockSummary (skips full ORM row construction)
+_SUMMARY_COLUMNS = tuple(
+    getattr(ProductStock, name) for name in ProductStockSummary.model_fields
+)
 
 
 class ProductService:
@@ -52,6 +61,43 @@ class ProductService:
             result = await session.execute(query)
             return list(result.scalars().all())
 
+    async def list_products_after(
+        self,
+        cursor: tuple[datetime, UUID] | None = None,
+        limit: int = 50,
+        active_only: bool = True,
+    ) -> list[ProductStock]:
+        """
+        List products with keyset (cursor) pagination.
+
+        Orders by (created_at, id) and seeks past the cursor instead of
+        using OFFSET, so every page costs the same regardless of depth.
+
+        Args:
+            cursor: (created_at, id) of the last product of the previous page,
+                or None for the first page
+            limit: Maximum number of products to return
+            active_only: If True, only return active products
+
+        Returns:
+            List of ProductStock instances
+        """
+        async with self.session_factory() as session:
+            query = select(ProductStock)
+
+            if active_only:
+                query = query.where(ProductStock.is_active == True)  # noqa: E712
+
+            if cursor is not None:
+                query = query.where(
+                    tuple_(ProductStock.created_at, ProductStock.id) > tuple_(*cursor)
+                )
+
+            query = query.order_by(ProductStock.created_at, ProductStock.id).limit(limit)
+
+            result = await session.execute(query)
+            return list(result.scalars().all())
+
     async def get_product(self, product_id: UUID) -> ProductStock | None:
         """
         Get a single product by ID.
@@ -67,6 +113,26 @@ class ProductService:
             result = await session.execute(query)
             return result.scalar_one_or_none()
 
+    async def get_products_by_ids(self, product_ids: Sequence[UUID]) -> list[ProductStock]:
+        """
+        Get several products by ID in a single query.
+
+        Args:
+            product_ids: UUIDs of the products
+
+        Returns:
+            List of found ProductStock instances (unordered, missing IDs skipped)
+        """
+        async with self.session_factory() as session:
+            # id = ANY(:ids) binds one array parameter, so the SQL text (and
+            # its cached plan) is the same for any number of IDs, unlike IN (...)
+            ids = bindparam(
+                "product_ids", list(product_ids), type_=ARRAY(PG_UUID(as_uuid=True))
+            )
+            query = select(ProductStock).where(ProductStock.id == any_(ids))
+            result = await session.execute(query)
+            return list(result.scalars().all())
+
     async def search_by_name(
         self,
         name: str,
@@ -97,6 +163,39 @@ class ProductService:
             result = await session.execute(query)
             return list(result.scalars().all())
 
+    async def search_summary_by_name(
+        self,
+        name: str,
+        limit: int = 20,
+        active_only: bool = True,
+    ) -> list[ProductStockSummary]:
+        """
+        Search products by name (case-insensitive), fetching summary columns only.
+
+        Same filtering and ordering as search_by_name, but selects just the
+        ProductStockSummary columns and skips ORM object construction.
+
+        Args:
+            name: Search term for product name
+            limit: Maximum number of results
+            active_only: If True, only return active products
+
+        Returns:
+            List of matching ProductStockSummary models
+        """
+        async with self.session_factory() as session:
+            query = select(*_SUMMARY_COLUMNS).where(
+                ProductStock.product_name.ilike(f"%{name}%")
+            )
+
+            if active_only:
+                query = query.where(ProductStock.is_active == True)  # noqa: E712
+
+            query = query.order_by(ProductStock.product_name).limit(limit)
+
+            result = await session.execute(query)
+            return [ProductStockSummary.from_row(row) for row in result.mappings()]
+
     async def get_low_stock_products(self, limit: int = 50) -> list[ProductStock]:
         """
         Get products with stock below reorder point.
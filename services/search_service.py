@@ -4,13 +4,21 @@ Search Service for Business Backend.
 Orchestrates LLM with product search tool for semantic queries.
 """
 
+import asyncio
+import re
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 
-from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.messages import (
+    AIMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
 from loguru import logger
 
-from business_backend.database.models import ProductStock
+from business_backend.domain.product_schemas import ProductStockSummary
 from business_backend.llm.provider import LLMProvider
 from business_backend.llm.tools.product_search_tool import (
     ProductSearchTool,
@@ -24,7 +32,7 @@ class SearchResult:
     """Result from semantic search."""
 
     answer: str
-    products_found: list[ProductStock]
+    products_found: list[ProductStockSummary]
     query: str
 
 
@@ -45,6 +53,13 @@ If no products are found, let the user know politely and suggest they try a diff
 
 Respond in the same language as the user's query."""
 
+    # Built once: every request sends the same system message object, an
+    # identical prompt prefix (eligible for the provider's prompt caching)
+    _SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+
+    # Question words and punctuation stripped from fallback queries (one pass)
+    _STOPWORDS_RE = re.compile(r"\b(?:tienen|hay|existe|buscar|quiero|stock)\b|[?¿]")
+
     def __init__(
         self,
         llm_provider: LLMProvider | None,
@@ -65,15 +80,32 @@ Respond in the same language as the user's query."""
         
         self.search_tool: ProductSearchTool | None = None
         self.image_tool: Any | None = None
+        # LLM with the tools bound (fixed per instance, so bound once here)
+        self._model_with_tools: Any | None = None
+        # Tool name -> handler taking the tool call args
+        self._tool_dispatch: dict[str, Callable[[dict[str, Any]], Awaitable[str]]] = {}
 
         if llm_provider is not None:
-            self.search_tool = create_product_search_tool(product_service)
-            
+            search_tool = self.search_tool = create_product_search_tool(product_service)
+            self._tool_dispatch["product_search"] = lambda args: search_tool._arun(
+                args["search_term"]
+            )
+
             if inference_service is not None:
                 from business_backend.llm.tools.image_recognition_tool import (
                     create_image_recognition_tool,
                 )
-                self.image_tool = create_image_recognition_tool(inference_service)
+                image_tool = self.image_tool = create_image_recognition_tool(
+                    inference_service
+                )
+                self._tool_dispatch["image_recognition"] = lambda args: image_tool._arun(
+                    args["image_path"]
+                )
+
+            tools = [self.search_tool]
+            if self.image_tool:
+                tools.append(self.image_tool)
+            self._model_with_tools = llm_provider.bind_tools(tools)
 
     async def semantic_search(self, query: str) -> SearchResult:
         """
@@ -98,43 +130,28 @@ Respond in the same language as the user's query."""
 
     async def _llm_search(self, query: str) -> SearchResult:
         """Perform search using LLM with tool calling."""
-        assert self.llm_provider is not None
+        assert self._model_with_tools is not None
         assert self.search_tool is not None
 
-        # Bind tools to model
-        tools = [self.search_tool]
-        if self.image_tool:
-            tools.append(self.image_tool)
-            
-        model_with_tools = self.llm_provider.bind_tools(tools)
+        model_with_tools = self._model_with_tools
 
         # Create messages
-        messages = [
-            {"role": "system", "content": self.SYSTEM_PROMPT},
-            {"role": "user", "content": query},
-        ]
+        messages = [self._SYSTEM_MESSAGE, HumanMessage(content=query)]
 
         # First LLM call - may request tool use
         response = await model_with_tools.ainvoke(messages)
+        products_found: list[ProductStockSummary] = []
 
         # Check if tool was called
         if hasattr(response, "tool_calls") and response.tool_calls:
-            # Execute tool calls
+            # Execute tool calls concurrently
+            outcomes = await asyncio.gather(
+                *(self._call_tool(tool_call) for tool_call in response.tool_calls)
+            )
             tool_messages = []
-            for tool_call in response.tool_calls:
-                result_content = "Error: Unknown tool"
-                
-                if tool_call["name"] == "product_search":
-                    # Execute the search
-                    result_content = await self.search_tool._arun(
-                        tool_call["args"]["search_term"]
-                    )
-                elif tool_call["name"] == "image_recognition" and self.image_tool:
-                    # Execute image recognition
-                    result_content = await self.image_tool._arun(
-                        tool_call["args"]["image_path"]
-                    )
-                    
+            for tool_call, (result_content, found) in zip(response.tool_calls, outcomes):
+                if found is not None:
+                    products_found = found  # Last product search wins
                 tool_messages.append(
                     ToolMessage(
                         content=result_content,
@@ -144,8 +161,7 @@ Respond in the same language as the user's query."""
 
             # Second LLM call with tool results
             messages_with_tools = [
-                {"role": "system", "content": self.SYSTEM_PROMPT},
-                {"role": "user", "content": query},
+                *messages,
                 response,  # AI message with tool calls
                 *tool_messages,  # Tool results
             ]
@@ -166,10 +182,30 @@ Respond in the same language as the user's query."""
 
         return SearchResult(
             answer=answer,
-            products_found=self.search_tool.get_last_results(),
+            products_found=products_found,
             query=query,
         )
 
+    async def _call_tool(
+        self, tool_call: dict[str, Any]
+    ) -> tuple[str, list[ProductStockSummary] | None]:
+        """
+        Run one tool call requested by the LLM.
+
+        Returns the tool output and, for product searches, the products found.
+        Tool calls run as separate tasks, so the search tool's per-context
+        results are read here, inside the task that set them.
+        """
+        handler = self._tool_dispatch.get(tool_call["name"])
+        if handler is None:
+            return "Error: Unknown tool", None
+
+        result_content = await handler(tool_call["args"])
+        if tool_call["name"] == "product_search":
+            assert self.search_tool is not None
+            return result_content, self.search_tool.get_last_results()
+        return result_content, None
+
     async def _fallback_search(self, query: str) -> SearchResult:
         """
         Fallback search without LLM.
@@ -178,12 +214,8 @@ Respond in the same language as the user's query."""
         """
         # Simple keyword extraction (just use the query as search term)
         # In production, you might want more sophisticated NLP
-        search_term = query.strip()
-
         # Remove common question words
-        for word in ["tienen", "hay", "existe", "buscar", "quiero", "stock", "?", "¿"]:
-            search_term = search_term.lower().replace(word, "")
-        search_term = search_term.strip()
+        search_term = self._STOPWORDS_RE.sub("", query.lower()).strip()
 
         if not search_term:
             return SearchResult(
@@ -192,7 +224,9 @@ Respond in the same language as the user's query."""
                 query=query,
             )
 
-        products = await self.product_service.search_by_name(search_term, limit=10)
+        products = await self.product_service.search_summary_by_name(
+            search_term, limit=10
+        )
 
         if not products:
             answer = f"No encontré productos que coincidan con '{search_term}'."
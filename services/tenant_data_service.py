@@ -3,20 +3,34 @@ Service for reading tenant data from CSV files.
 
 This service loads FAQs and context chunks from CSV files stored in
 business_backend/data/{tenant}/ directory.
+
+Parsed results are cached per (path, mtime): the CSVs are effectively
+static, so repeated requests skip parsing until a file is modified.
+Concurrent reads of the same tenant file share one load, so a cold
+start parses each file once instead of once per waiting request.
 """
 
+import asyncio
+import csv
+import functools
+import sys
+from collections.abc import Callable, Iterable
 from pathlib import Path
+from typing import Any
 
-import pandas as pd
 from loguru import logger
 
 from business_backend.domain.faq_models import (
+    FAQ_KINDS,
     DocumentChunk,
     FAQData,
     FAQItemData,
     FAQResponses,
 )
 
+# Loads in progress: (file kind, tenant) -> future shared by concurrent readers
+_IN_FLIGHT: dict[tuple[str, str], asyncio.Future[Any]] = {}
+
 
 class TenantDataService:
     """Service for loading tenant-specific data from CSV files."""
@@ -41,73 +55,10 @@ class TenantDataService:
         Raises:
             FileNotFoundError: If CSV file doesn't exist
         """
-        csv_path = Path(f"business_backend/data/{tenant}/faqs.csv")
-
-        if not csv_path.exists():
-            raise FileNotFoundError(f"FAQs CSV not found: {csv_path}")
-
-        logger.info(f"📖 Reading FAQs from: {csv_path}")
-
-        df = pd.read_csv(csv_path)
-
-        # Initialize lists and responses
-        greeting_patterns: list[str] = []
-        farewell_patterns: list[str] = []
-        gratitude_patterns: list[str] = []
-        assistant_info_patterns: list[str] = []
-        help_request_patterns: list[str] = []
-        responses_dict: dict[str, str] = {}
-        faq_items: list[FAQItemData] = []
-
-        # Process each row
-        for _, row in df.iterrows():
-            row_type = str(row["type"]).strip()
-            patterns = str(row["patterns"]).strip().split(";;;")  # Split by ;;;
-            response = str(row["response"]).strip()
-            category = str(row["category"]).strip()
-
-            if row_type == "greeting":
-                greeting_patterns.extend(patterns)
-                responses_dict["greeting"] = response
-            elif row_type == "farewell":
-                farewell_patterns.extend(patterns)
-                responses_dict["farewell"] = response
-            elif row_type == "gratitude":
-                gratitude_patterns.extend(patterns)
-                responses_dict["gratitude"] = response
-            elif row_type == "assistant_info":
-                assistant_info_patterns.extend(patterns)
-                responses_dict["assistant_info"] = response
-            elif row_type == "help_request":
-                help_request_patterns.extend(patterns)
-                responses_dict["help_request"] = response
-            elif row_type == "faq":
-                # FAQ items need question field (use category as question title)
-                faq_item = FAQItemData(
-                    question=category.replace("_", " ").title(),
-                    patterns=patterns,
-                    answer=response,
-                    category=category,
-                )
-                faq_items.append(faq_item)
-
-        # Build Pydantic model
-        faq_data = FAQData(
-            greeting_patterns=greeting_patterns,
-            farewell_patterns=farewell_patterns,
-            gratitude_patterns=gratitude_patterns,
-            assistant_info_patterns=assistant_info_patterns,
-            help_request_patterns=help_request_patterns,
-            responses=FAQResponses(**responses_dict),
-            faq_items=faq_items,
-        )
-
-        logger.info(
-            f"✅ Loaded FAQs for tenant '{tenant}': {len(faq_data.faq_items)} items, {len(faq_data.greeting_patterns)} greetings"
+        return await TenantDataService._shared_load(
+            "faqs", tenant, TenantDataService._read_faqs_sync
         )
 
-        return faq_data
-
     @staticmethod
     async def read_chunks_csv(tenant: str) -> list[DocumentChunk]:
         """
@@ -127,25 +78,146 @@ class TenantDataService:
         Raises:
             FileNotFoundError: If CSV file doesn't exist
         """
+        return await TenantDataService._shared_load(
+            "chunks", tenant, TenantDataService._read_chunks_sync
+        )
+
+    async def preload(self, tenants: Iterable[str]) -> None:
+        """
+        Load FAQs and chunks for the given tenants into the cache.
+
+        Missing or unreadable files are logged and skipped.
+
+        Args:
+            tenants: Tenant names to preload
+        """
+        tenants = list(tenants)
+        results = await asyncio.gather(
+            *(self.read_faqs_csv(tenant) for tenant in tenants),
+            *(self.read_chunks_csv(tenant) for tenant in tenants),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ Could not preload tenant data: {result}")
+
+        logger.info(f"✅ Preloaded tenant data for: {', '.join(tenants)}")
+
+    @staticmethod
+    async def _shared_load(kind: str, tenant: str, read: Callable[[str], Any]) -> Any:
+        """
+        Run `read(tenant)` in a worker thread, off the event loop.
+
+        Callers arriving while a read of the same file is in progress
+        await that read instead of starting another one.
+        """
+        key = (kind, tenant)
+        future = _IN_FLIGHT.get(key)
+        if future is None:
+            future = asyncio.ensure_future(asyncio.to_thread(read, tenant))
+            _IN_FLIGHT[key] = future
+            future.add_done_callback(lambda _: _IN_FLIGHT.pop(key, None))
+        # Shielded: one cancelled caller must not cancel the shared load
+        return await asyncio.shield(future)
+
+    @staticmethod
+    def _read_faqs_sync(tenant: str) -> FAQData:
+        """Blocking body of read_faqs_csv (runs in a worker thread)."""
+        csv_path = Path(f"business_backend/data/{tenant}/faqs.csv")
+
+        if not csv_path.exists():
+            raise FileNotFoundError(f"FAQs CSV not found: {csv_path}")
+
+        return TenantDataService._load_faqs(csv_path, csv_path.stat().st_mtime_ns)
+
+    @staticmethod
+    def _read_chunks_sync(tenant: str) -> list[DocumentChunk]:
+        """Blocking body of read_chunks_csv (runs in a worker thread)."""
         csv_path = Path(f"business_backend/data/{tenant}/chunks.csv")
 
         if not csv_path.exists():
             raise FileNotFoundError(f"Chunks CSV not found: {csv_path}")
 
-        logger.info(f"📖 Reading chunks from: {csv_path}")
+        return TenantDataService._load_chunks(csv_path, csv_path.stat().st_mtime_ns)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _load_faqs(csv_path: Path, mtime_ns: int) -> FAQData:
+        """
+        Parse a FAQs CSV (cached by path and modification time).
 
-        df = pd.read_csv(csv_path)
+        Editing the file changes mtime_ns and therefore the cache key.
+        The returned model is shared between callers and must not be mutated.
+        """
+        logger.info(f"📖 Reading FAQs from: {csv_path}")
 
-        # Convert to Pydantic models
-        chunks: list[DocumentChunk] = []
-        for _, row in df.iterrows():
-            chunk = DocumentChunk(
-                content=str(row.get("text", "")),
-                category=str(row.get("category", "")),
-                metadata={},
-            )
-            chunks.append(chunk)
+        patterns_by_kind: dict[str, list[str]] = {
+            f"{kind}_patterns": [] for kind in FAQ_KINDS
+        }
+        responses_dict: dict[str, str] = {}
+        faq_items: list[FAQItemData] = []
+
+        # Stream rows with the stdlib reader (no DataFrame)
+        with csv_path.open(newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                row_type = row["type"].strip()
+                # Interned: patterns/responses repeated across rows and tenants
+                # share one object for the life of the worker
+                patterns = [
+                    sys.intern(pattern)
+                    for pattern in row["patterns"].strip().split(";;;")  # Split by ;;;
+                ]
+                response = sys.intern(row["response"].strip())
+
+                if row_type == "faq":
+                    # FAQ items need question field (use category as question title)
+                    category = row["category"].strip()
+                    faq_items.append(
+                        FAQItemData.model_construct(
+                            question=category.replace("_", " ").title(),
+                            patterns=patterns,
+                            answer=response,
+                            category=category,
+                        )
+                    )
+                elif row_type in FAQ_KINDS:
+                    patterns_by_kind[f"{row_type}_patterns"].extend(patterns)
+                    responses_dict[row_type] = response  # Last row wins
+
+        # Build Pydantic model (fields are already str/list[str]: skip validation)
+        faq_data = FAQData.model_construct(
+            **patterns_by_kind,
+            responses=FAQResponses.model_construct(**responses_dict),
+            faq_items=faq_items,
+        )
+
+        logger.info(
+            f"✅ Loaded FAQs from '{csv_path}': {len(faq_data.faq_items)} items, {len(faq_data.greeting_patterns)} greetings"
+        )
+
+        return faq_data
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _load_chunks(csv_path: Path, mtime_ns: int) -> list[DocumentChunk]:
+        """
+        Parse a chunks CSV (cached by path and modification time).
+
+        The returned list is shared between callers and must not be mutated.
+        """
+        logger.info(f"📖 Reading chunks from: {csv_path}")
+
+        # Stream rows with the stdlib reader (no DataFrame)
+        with csv_path.open(newline="", encoding="utf-8") as f:
+            chunks: list[DocumentChunk] = [
+                DocumentChunk.model_construct(
+                    content=row.get("text") or "",
+                    category=row.get("category") or "",
+                    metadata={},
+                )
+                for row in csv.DictReader(f)
+            ]
 
-        logger.info(f"✅ Loaded {len(chunks)} chunks for tenant '{tenant}'")
+        logger.info(f"✅ Loaded {len(chunks)} chunks from '{csv_path}'")
 
         return chunks
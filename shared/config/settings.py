@@ -16,11 +16,20 @@ def _load_dotenv_once(env_path: str | None = None):
         _ = dotenv.load_dotenv(dotenv.find_dotenv())
 
 
+# Find and load .env at import time (workers import this before serving),
+# not on the first request; variables already set in the environment win
+_load_dotenv_once()
+
+
+# Cached per settings class: the first call loads .env and validates, later
+# calls return the same instance
+@functools.cache
 def get_settings(cls: type[TSettings]) -> TSettings:
     _load_dotenv_once()
     return cls()
 
 
+@functools.cache
 def get_settings_local(
     cls: type[TSettings], env_path: str = ".env.production"
 ) -> TSettings:
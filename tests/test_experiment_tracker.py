@@ -0,0 +1,48 @@
+"""Tests for ExperimentTracker persistence."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from business_backend.ml.training.experiment_tracker import ExperimentTracker
+
+
+def test_metric_histories_are_saved_per_key(tmp_path: Path) -> None:
+    tracker = ExperimentTracker(artifact_location=tmp_path)
+    run_id = tracker.start_run("exp", expected_steps=2)
+
+    for step in range(3):  # Grows past expected_steps
+        tracker.log_metrics({"loss": 1.0 / (step + 1), "train/loss": step}, step=step)
+    tracker.end_run()
+
+    metrics_dir = tmp_path / "exp" / run_id / "metrics"
+    np.testing.assert_array_equal(
+        np.load(metrics_dir / "loss.npy"), [[0, 1.0], [1, 0.5], [2, 1.0 / 3]]
+    )
+    # Hierarchical keys are saved in subdirectories
+    np.testing.assert_array_equal(
+        np.load(metrics_dir / "train" / "loss.npy"), [[0, 0], [1, 1], [2, 2]]
+    )
+    assert tracker.get_run(run_id).metrics == {"loss": 1.0 / 3, "train/loss": 2}
+
+
+def test_params_are_kept_and_persisted(tmp_path: Path) -> None:
+    tracker = ExperimentTracker(artifact_location=tmp_path)
+    run_id = tracker.start_run("exp")
+
+    tracker.log_params({"epochs": 3, "learning_rate": 1e-3})
+    tracker.log_param("device", Path("cuda"))  # Non-JSON values are stored as str
+    tracker.end_run()
+
+    expected = {"epochs": 3, "learning_rate": 1e-3, "device": "cuda"}
+    assert json.loads((tmp_path / "exp" / run_id / "params.json").read_text()) == expected
+    assert tracker.get_run(run_id).params == {**expected, "device": Path("cuda")}
+
+
+def test_logging_without_a_run_fails() -> None:
+    tracker = ExperimentTracker()
+
+    with pytest.raises(RuntimeError, match="No active run"):
+        tracker.log_param("epochs", 3)
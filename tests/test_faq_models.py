@@ -0,0 +1,56 @@
+"""Tests for the FAQ pattern matcher."""
+
+from business_backend.domain.faq_models import FAQData, FAQItemData, FAQMatcher, FAQResponses
+
+
+def test_regex_patterns_match_their_category() -> None:
+    matcher = FAQMatcher(
+        [
+            ("greeting", r"^(hi|hello|hey)(\s|!|\.|\?)*$"),
+            ("farewell", r".*(goodbye|bye).*"),
+        ]
+    )
+
+    assert matcher.match("  Hello! ") == "greeting"
+    assert matcher.match("ok, bye for now") == "farewell"
+    assert matcher.match("hello there, what is the price?") is None
+
+
+def test_invalid_regex_is_matched_literally() -> None:
+    matcher = FAQMatcher([("pricing", "price (usd"), ("other", "zzz")])
+
+    assert matcher.match("what is the price (USD today") == "pricing"
+    assert matcher.match("what is the price usd") is None
+
+
+def test_unspliceable_patterns_cannot_break_the_combined_regex() -> None:
+    # A named group would collide with the matcher's p<index> groups and a
+    # backreference would point at the wrong group once spliced
+    matcher = FAQMatcher([("a", "(?P<p1>x)"), ("b", r"(y)\1"), ("c", "(?i)zz")])
+
+    assert matcher.match("(?P<p1>x)") == "a"
+    assert matcher.match("yy") is None
+    assert matcher.match("say (?i)zz") == "c"
+
+
+def test_faq_data_matcher_covers_kinds_and_items() -> None:
+    faq_data = FAQData(
+        greeting_patterns=[r"^hola$"],
+        responses=FAQResponses(greeting="¡Hola!"),
+        faq_items=[
+            FAQItemData(
+                question="hours",
+                patterns=[r".*what.*hours.*"],
+                answer="9 to 5",
+                category="hours",
+            )
+        ],
+    )
+
+    assert faq_data.matcher.match("Hola") == "greeting"
+    assert faq_data.matcher.match("What are your hours?") == "hours"
+    assert faq_data.matcher is faq_data.matcher  # Compiled once
+
+
+def test_empty_matcher_matches_nothing() -> None:
+    assert FAQMatcher([]).match("hello") is None
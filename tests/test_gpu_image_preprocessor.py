@@ -0,0 +1,60 @@
+"""Tests for GPUImagePreprocessor feeding ImageClassifier."""
+
+import numpy as np
+import pytest
+
+from business_backend.ml.models.image_classifier import ImageClassifier
+from business_backend.ml.preprocessing import GPUImagePreprocessor, ImagePreprocessor
+from business_backend.ml.preprocessing.image_preprocessor import ImageConfig
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("PIL")
+pytestmark = pytest.mark.skipif(not torch.cuda.is_available(), reason="needs a CUDA device")
+
+
+class _MeanBackend:
+    """Backend scoring two classes from the mean pixel value of each image."""
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        mean = batch.reshape(len(batch), -1).mean(axis=1)
+        return np.stack([1.0 - mean, mean], axis=1)
+
+
+@pytest.fixture
+async def classifier() -> ImageClassifier:
+    model = ImageClassifier()
+    await model.load("dummy_path")
+    model._model = _MeanBackend()
+    model.set_class_labels(["dark", "bright"])
+    return model
+
+
+def _images() -> list[np.ndarray]:
+    # Different decoded sizes, as real uploads have
+    return [
+        np.full((300, 400, 3), 250, dtype=np.uint8),
+        np.full((120, 90, 3), 5, dtype=np.uint8),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_output_matches_the_cpu_preprocessor() -> None:
+    gpu = await GPUImagePreprocessor(ImageConfig(device="cuda")).process_batch(_images())
+    cpu = await ImagePreprocessor().process_batch(_images())
+
+    assert isinstance(gpu, np.ndarray)
+    assert gpu.shape == cpu.shape == (2, 224, 224, 3)
+    assert gpu.dtype == np.float32
+    np.testing.assert_allclose(gpu, cpu, atol=0.02)
+
+
+@pytest.mark.asyncio
+async def test_preprocessed_images_classify(classifier: ImageClassifier) -> None:
+    preprocessor = GPUImagePreprocessor(ImageConfig(device="cuda"))
+    bright, dark = _images()
+
+    single = await classifier.predict(await preprocessor.process(bright))
+    batch = await classifier.predict_batch(await preprocessor.process_batch([bright, dark]))
+
+    assert single["prediction"] == "bright"
+    assert batch["predictions"] == ["bright", "dark"]
@@ -0,0 +1,39 @@
+"""Tests for GraphQL pagination arguments."""
+
+import pytest
+import strawberry
+from graphql import GraphQLError, parse, validate
+
+from business_backend.api.graphql.queries import BusinessQuery, _check_pagination
+from business_backend.api.graphql.types import MAX_PAGE_SIZE
+
+
+@pytest.mark.parametrize("limit", [1, 50, MAX_PAGE_SIZE])
+def test_limit_in_range_is_accepted(limit: int) -> None:
+    _check_pagination(limit, 0)
+
+
+@pytest.mark.parametrize("limit", [0, -1, MAX_PAGE_SIZE + 1])
+def test_limit_out_of_range_is_rejected(limit: int) -> None:
+    with pytest.raises(GraphQLError, match="limit"):
+        _check_pagination(limit)
+
+
+def test_negative_offset_is_rejected() -> None:
+    with pytest.raises(GraphQLError, match="offset"):
+        _check_pagination(10, -1)
+
+
+def test_pagination_arguments_accept_int_variables() -> None:
+    schema = strawberry.Schema(query=BusinessQuery)
+    document = parse(
+        """
+        query Products($limit: Int!, $offset: Int!) {
+          products(limit: $limit, offset: $offset) { id }
+          productsAfter(limit: $limit) { pageInfo { hasNextPage } }
+          searchProducts(name: "leche", limit: $limit) { productName }
+        }
+        """
+    )
+
+    assert validate(schema._schema, document) == []
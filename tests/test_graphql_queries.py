@@ -0,0 +1,203 @@
+"""Tests for the product GraphQL queries and their schema extensions."""
+
+import asyncio
+import dataclasses
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID
+
+import aioinject
+import pytest
+import strawberry
+from aioinject.ext.strawberry import AioInjectExtension
+
+from business_backend.api.graphql.extensions import QueryCostLimiter
+from business_backend.api.graphql.queries import (
+    BusinessQuery,
+    _decode_cursor,
+    _encode_cursor,
+    _to_product_stock_type,
+)
+from business_backend.api.graphql.types import ProductStockType
+from business_backend.services.product_service import ProductService
+
+_START = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _product_row(index: int) -> SimpleNamespace:
+    """A stand-in for a ProductStock row with every GraphQL field set."""
+    values: dict[str, Any] = {
+        "id": uuid.UUID(int=index + 1),
+        "created_at": _START + timedelta(minutes=index // 2),  # Pairs share a timestamp
+        "last_updated_at": _START,
+        "product_id": f"P{index}",
+        "product_name": f"Product {index}",
+        "product_sku": None,
+        "supplier_id": "S1",
+        "supplier_name": "Supplier",
+        "quantity_on_hand": index,
+        "quantity_reserved": 0,
+        "quantity_available": index,
+        "minimum_stock_level": 1,
+        "reorder_point": 2,
+        "optimal_stock_level": 3,
+        "reorder_quantity": 4,
+        "average_daily_usage": Decimal("1.5"),
+        "last_order_date": date(2024, 1, 1),
+        "last_stock_count_date": None,
+        "expiration_date": None,
+        "unit_cost": Decimal("2.50"),
+        "total_value": Decimal("25.00"),
+        "batch_number": None,
+        "warehouse_location": "A1",
+        "shelf_location": None,
+        "stock_status": 1,
+        "is_active": True,
+        "notes": None,
+    }
+    return SimpleNamespace(**values)
+
+
+class _FakeProductService(ProductService):
+    """In-memory ProductService recording the batched ID lookups."""
+
+    def __init__(self, rows: list[SimpleNamespace]) -> None:
+        self.rows = sorted(rows, key=lambda p: (p.created_at, p.id))
+        self.id_batches: list[list[UUID]] = []
+
+    async def list_products_after(
+        self,
+        cursor: tuple[datetime, UUID] | None = None,
+        limit: int = 50,
+        active_only: bool = True,
+    ) -> list[Any]:
+        rows = [p for p in self.rows if cursor is None or (p.created_at, p.id) > cursor]
+        return rows[:limit]
+
+    async def get_products_by_ids(self, product_ids: Any) -> list[Any]:
+        self.id_batches.append(list(product_ids))
+        await asyncio.sleep(0)
+        return [p for p in self.rows if p.id in set(product_ids)]
+
+
+@pytest.fixture
+def product_service() -> _FakeProductService:
+    return _FakeProductService([_product_row(i) for i in range(7)])
+
+
+@pytest.fixture
+def schema(product_service: _FakeProductService) -> strawberry.Schema:
+    container = aioinject.Container()
+    container.register(aioinject.Object(product_service, ProductService))
+    return strawberry.Schema(
+        query=BusinessQuery,
+        extensions=[AioInjectExtension(container), QueryCostLimiter(max_cost=1_500)],
+    )
+
+
+def test_row_converter_copies_every_field() -> None:
+    row = _product_row(3)
+
+    converted = _to_product_stock_type(row)
+
+    assert isinstance(converted, ProductStockType)
+    for field in dataclasses.fields(ProductStockType):
+        assert getattr(converted, field.name) == getattr(row, field.name)
+
+
+def test_cursor_round_trips() -> None:
+    row = _product_row(5)
+
+    assert _decode_cursor(_encode_cursor(row)) == (row.created_at, row.id)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm90IGpzb24=", "WzFd"])
+def test_malformed_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _decode_cursor(cursor)
+
+
+async def test_products_after_walks_every_row_once(
+    schema: strawberry.Schema, product_service: _FakeProductService
+) -> None:
+    query = """
+        query Page($after: ID, $limit: Int!) {
+          productsAfter(after: $after, limit: $limit) {
+            items { id }
+            pageInfo { endCursor hasNextPage }
+          }
+        }
+    """
+    seen: list[str] = []
+    after = None
+    pages = 0
+    while True:
+        result = await schema.execute(query, variable_values={"after": after, "limit": 3})
+        assert result.errors is None
+        page = result.data["productsAfter"]
+        seen.extend(item["id"] for item in page["items"])
+        pages += 1
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        after = page["pageInfo"]["endCursor"]
+
+    assert pages == 3
+    assert seen == [str(p.id) for p in product_service.rows]
+
+
+async def test_out_of_range_limit_is_a_graphql_error(schema: strawberry.Schema) -> None:
+    result = await schema.execute("{ productsAfter(limit: 0) { items { id } } }")
+
+    assert result.errors is not None
+    assert "limit must be between" in result.errors[0].message
+
+
+async def test_product_lookups_are_batched(
+    schema: strawberry.Schema, product_service: _FakeProductService
+) -> None:
+    first, second = product_service.rows[0].id, product_service.rows[1].id
+    missing = uuid.UUID(int=999)
+
+    result = await schema.execute(
+        f"""
+        {{
+          a: product(id: "{first}") {{ productName }}
+          b: product(id: "{second}") {{ productName }}
+          c: product(id: "{missing}") {{ productName }}
+        }}
+        """,
+        context_value={},
+    )
+
+    assert result.errors is None
+    assert result.data == {
+        "a": {"productName": "Product 0"},
+        "b": {"productName": "Product 1"},
+        "c": None,
+    }
+    assert product_service.id_batches == [[first, second, missing]]
+
+
+async def test_query_cost_limit_rejects_wide_nested_pages(schema: strawberry.Schema) -> None:
+    cheap = await schema.execute("{ productsAfter(limit: 2) { items { id } } }")
+    assert cheap.errors is None
+
+    # A variable limit is costed as MAX_PAGE_SIZE rows: 1 + 200 * (1 + 8) > 1500
+    costly = await schema.execute(
+        """
+        query Costly($limit: Int!) {
+          productsAfter(limit: $limit) {
+            items {
+              id productName productSku supplierName
+              quantityAvailable unitCost warehouseLocation isActive
+            }
+          }
+        }
+        """,
+        variable_values={"limit": 2},
+    )
+    assert costly.errors is not None
+    assert "exceeds maximum allowed cost" in costly.errors[0].message
@@ -0,0 +1,77 @@
+"""Tests for the demo image classifier."""
+
+import numpy as np
+import pytest
+
+from business_backend.ml.models.image_classifier import ImageClassifier
+from business_backend.ml.preprocessing import EncodedImage
+
+
+@pytest.fixture
+async def classifier() -> ImageClassifier:
+    model = ImageClassifier()
+    await model.load("dummy_path")
+    return model
+
+
+@pytest.mark.asyncio
+async def test_uploaded_bytes_classify_by_filename(classifier: ImageClassifier) -> None:
+    result = await classifier.predict(EncodedImage(b"\xff\xd8\xff\xe0", "test_milk.jpg"))
+
+    assert result["prediction"] == "Leche Entera 1L"
+    assert result["confidence"] == 0.98
+
+
+@pytest.mark.asyncio
+async def test_upload_without_known_filename_is_unknown(classifier: ImageClassifier) -> None:
+    result = await classifier.predict(EncodedImage(b"\xff\xd8\xff\xe0", None))
+
+    assert result["prediction"] == "unknown_product"
+
+
+@pytest.mark.asyncio
+async def test_batch_of_uploads_classifies_each(classifier: ImageClassifier) -> None:
+    results = await classifier.predict_batch(
+        [EncodedImage(b"", "CAFE.png"), EncodedImage(b"", "cereal.jpg")]
+    )
+
+    assert [r["prediction"] for r in results] == ["Café Molido Premium", "Cereal Avena"]
+
+
+@pytest.mark.asyncio
+async def test_array_without_backend_gets_the_demo_result(classifier: ImageClassifier) -> None:
+    image = np.zeros(classifier.input_shape, dtype=np.float32)
+
+    result = await classifier.predict(image)
+    batch = await classifier.predict_batch(np.stack([image, image]))
+
+    assert result["prediction"] == "unknown_product"
+    assert [r["prediction"] for r in batch] == ["unknown_product"] * 2
+
+
+@pytest.mark.parametrize(
+    ("filename", "prediction"),
+    [
+        ("cereal_milk.jpg", "Leche Entera 1L"),  # First rule wins, not first position
+        ("cafe_con_leche.png", "Leche Entera 1L"),
+        ("cereal_coffee.jpg", "Café Molido Premium"),
+        ("CEREAL.jpg", "Cereal Avena"),
+        ("bread.jpg", "unknown_product"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_demo_rules_keep_their_priority(
+    classifier: ImageClassifier, filename: str, prediction: str
+) -> None:
+    assert (await classifier.predict(filename))["prediction"] == prediction
+
+
+@pytest.mark.asyncio
+async def test_memory_bytes_counts_loaded_weights(classifier: ImageClassifier) -> None:
+    assert classifier.memory_bytes == 0  # demo mock holds no weights
+
+    classifier._weights_handle = {"fc.weight": np.zeros((10, 10), np.float32)}
+    assert classifier.memory_bytes == 400
+
+    await classifier.unload()
+    assert classifier.memory_bytes == 0
@@ -0,0 +1,85 @@
+"""Tests for InferenceService batch pipelining."""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from business_backend.ml.models.base import BaseModel
+from business_backend.ml.models.registry import ModelRegistry
+from business_backend.ml.preprocessing.base import BasePreprocessor
+from business_backend.ml.serving.inference_service import InferenceService
+
+
+class _EchoPreprocessor(BasePreprocessor):
+    """Passes chunks through, counting them."""
+
+    def __init__(self) -> None:
+        self.chunks = 0
+
+    async def process(self, data: Any) -> Any:
+        return data
+
+    async def process_batch(self, data_list: list[Any]) -> list[Any]:
+        self.chunks += 1
+        await asyncio.sleep(0)
+        return data_list
+
+    def validate(self, data: Any) -> bool:
+        return True
+
+
+class _FlakyModel(BaseModel):
+    """Fails on chunks containing "boom"; other chunks wait for a release."""
+
+    release: asyncio.Event
+    cancelled = 0
+
+    async def load(self, path: str | Path) -> None:
+        self._is_loaded = True
+
+    async def predict(self, data: Any) -> dict[str, Any]:
+        return {"prediction": data}
+
+    async def predict_batch(self, data_list: list[Any]) -> list[dict[str, Any]]:
+        if "boom" in data_list:
+            raise ValueError("bad chunk")
+        try:
+            await type(self).release.wait()
+        except asyncio.CancelledError:
+            type(self).cancelled += 1
+            raise
+        return [{"prediction": data} for data in data_list]
+
+
+@pytest.fixture
+def service() -> InferenceService:
+    _FlakyModel.release = asyncio.Event()
+    _FlakyModel.cancelled = 0
+    registry = ModelRegistry()
+    registry.register("flaky", _FlakyModel, "flaky.bin")
+    return InferenceService(registry, _EchoPreprocessor(), max_concurrency=4)
+
+
+async def test_pipelined_batch_keeps_input_order(service: InferenceService) -> None:
+    _FlakyModel.release.set()
+
+    results = await service.predict_batch("flaky", list(range(10)), chunk_size=3)
+
+    assert [r.prediction for r in results] == list(range(10))
+
+
+async def test_failed_chunk_cancels_the_rest_of_the_pipeline(service: InferenceService) -> None:
+    tasks_before = asyncio.all_tasks()
+    data = ["a", "b", "boom", "c"] + [str(i) for i in range(40)]
+
+    with pytest.raises(ValueError, match="bad chunk"):
+        await asyncio.wait_for(service.predict_batch("flaky", data, chunk_size=2), timeout=5)
+    await asyncio.sleep(0)
+
+    # Chunks still waiting were cancelled and nothing was left running
+    assert _FlakyModel.cancelled >= 1
+    assert asyncio.all_tasks() == tasks_before
+    # The producer stopped instead of preprocessing all 22 chunks
+    assert service.preprocessor.chunks < 22
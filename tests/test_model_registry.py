@@ -0,0 +1,100 @@
+"""Tests for ModelRegistry loading and eviction."""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+from business_backend.ml.models.base import BaseModel
+from business_backend.ml.models.registry import ModelRegistry, ModelStage
+
+
+class _SlowModel(BaseModel):
+    """Model whose predictions wait on an event, to hold them in flight."""
+
+    loads = 0
+    release: asyncio.Event
+
+    async def load(self, path: str | Path) -> None:
+        type(self).loads += 1
+        await asyncio.sleep(0)
+        self._is_loaded = True
+
+    async def predict(self, data: Any) -> dict[str, Any]:
+        assert self._is_loaded, "predicting on an unloaded model"
+        await type(self).release.wait()
+        assert self._is_loaded, "model unloaded during prediction"
+        return {"prediction": data}
+
+
+def _registry(max_loaded: int | None) -> ModelRegistry:
+    _SlowModel.loads = 0
+    _SlowModel.release = asyncio.Event()
+    registry = ModelRegistry(max_loaded=max_loaded)
+    for name in ("a", "b", "c"):
+        registry.register(name, _SlowModel, f"{name}.bin")
+    return registry
+
+
+async def _predict(registry: ModelRegistry, name: str) -> Any:
+    async with registry.acquire(name) as model:
+        return (await model.predict(name))["prediction"]
+
+
+async def test_concurrent_cold_loads_share_one_load() -> None:
+    registry = _registry(max_loaded=None)
+
+    models = await asyncio.gather(*(registry.load("a") for _ in range(5)))
+
+    assert _SlowModel.loads == 1
+    assert all(model is models[0] for model in models)
+
+
+async def test_least_recently_used_model_is_evicted() -> None:
+    registry = _registry(max_loaded=2)
+
+    evicted = await registry.load("a")
+    await registry.load("b")
+    await registry.load("c")
+
+    assert not registry.is_loaded("a")
+    assert not evicted.is_loaded
+    assert registry.is_loaded("b") and registry.is_loaded("c")
+
+
+async def test_models_in_use_are_not_evicted() -> None:
+    registry = _registry(max_loaded=1)
+
+    in_flight = [asyncio.create_task(_predict(registry, name)) for name in ("a", "b", "c")]
+    await asyncio.sleep(0.01)
+
+    # All three are in use: the registry stays over budget instead of
+    # unloading a model under a running prediction
+    assert all(registry.is_loaded(name) for name in ("a", "b", "c"))
+
+    _SlowModel.release.set()
+    assert await asyncio.gather(*in_flight) == ["a", "b", "c"]
+
+    # Once idle, eviction catches up to max_loaded
+    assert sum(registry.is_loaded(name) for name in ("a", "b", "c")) == 1
+
+
+def test_registry_is_unbounded_by_default() -> None:
+    assert ModelRegistry().max_loaded is None
+
+
+def test_stage_listing_keeps_registration_order() -> None:
+    registry = ModelRegistry()
+    names = [f"model_{i}" for i in range(20)]
+    for name in names:
+        registry.register(name, _SlowModel, f"{name}.bin", stage=ModelStage.PRODUCTION)
+    registry.register("dev", _SlowModel, "dev.bin")
+
+    assert [info.name for info in registry.list_models(ModelStage.PRODUCTION)] == names
+    assert [info.name for info in registry.list_models()] == [*names, "dev"]
+
+    registry.set_stage("model_3", ModelStage.STAGING)
+    registry.unregister("model_5")
+
+    remaining = [name for name in names if name not in ("model_3", "model_5")]
+    assert [info.name for info in registry.list_models(ModelStage.PRODUCTION)] == remaining
+    assert [info.name for info in registry.list_models(ModelStage.STAGING)] == ["model_3"]
@@ -0,0 +1,79 @@
+"""Tests for sharing in-flight tenant CSV loads."""
+
+import asyncio
+import threading
+
+from business_backend.services.tenant_data_service import _IN_FLIGHT, TenantDataService
+
+
+class _CountingReader:
+    """Blocking reader that waits for a release and counts its calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.release = threading.Event()
+
+    def __call__(self, tenant: str) -> str:
+        self.calls.append(tenant)
+        self.release.wait(timeout=5)
+        return f"data:{tenant}"
+
+
+async def _wait_for_calls(reader: _CountingReader, count: int) -> None:
+    while len(reader.calls) < count:
+        await asyncio.sleep(0.001)
+
+
+async def test_concurrent_reads_of_one_file_share_one_load() -> None:
+    reader = _CountingReader()
+
+    waiters = [
+        asyncio.create_task(TenantDataService._shared_load("faqs", "app", reader))
+        for _ in range(5)
+    ]
+    await _wait_for_calls(reader, 1)
+    reader.release.set()
+
+    assert await asyncio.gather(*waiters) == ["data:app"] * 5
+    assert reader.calls == ["app"]
+    assert ("faqs", "app") not in _IN_FLIGHT
+
+
+async def test_different_files_load_separately() -> None:
+    reader = _CountingReader()
+    reader.release.set()
+
+    results = await asyncio.gather(
+        TenantDataService._shared_load("faqs", "app", reader),
+        TenantDataService._shared_load("chunks", "app", reader),
+        TenantDataService._shared_load("faqs", "other", reader),
+    )
+
+    assert results == ["data:app", "data:app", "data:other"]
+    assert sorted(reader.calls) == ["app", "app", "other"]
+
+
+async def test_cancelled_caller_does_not_cancel_the_shared_load() -> None:
+    reader = _CountingReader()
+
+    cancelled = asyncio.create_task(TenantDataService._shared_load("faqs", "app", reader))
+    survivor = asyncio.create_task(TenantDataService._shared_load("faqs", "app", reader))
+    await _wait_for_calls(reader, 1)
+
+    cancelled.cancel()
+    reader.release.set()
+
+    assert await survivor == "data:app"
+    assert cancelled.cancelled()
+    assert reader.calls == ["app"]
+
+
+async def test_finished_load_is_not_reused_for_later_reads() -> None:
+    reader = _CountingReader()
+    reader.release.set()
+
+    await TenantDataService._shared_load("faqs", "app", reader)
+    await TenantDataService._shared_load("faqs", "app", reader)
+
+    # Caching finished results is the lru_cache's job, keyed by file mtime
+    assert reader.calls == ["app", "app"]